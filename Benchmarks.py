@@ -0,0 +1,820 @@
+"""
+Benchmarks for the data structures in this repository.
+Each benchmark_* function builds its structures, times the operations with
+time.perf_counter and prints a small table. Sizes are parameters so the large
+runs (10^6 keys and up) can be requested explicitly, e.g.:
+
+    python Benchmarks.py trees 1000000
+
+Running the module without arguments runs every benchmark at a small size.
+"""
+
+import heapq
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import DoublyLinkedList_cc
+import LinkedList
+import LinkedList_cc
+import NodeConstructor
+import StackQueue
+import Trees
+from HashTables import ConcurrentHashTable, DiskHashTable, HashTable, OpenAddressingHashTable
+from Heap import IndexedMinHeap, MaxHeap, MinHeap, k_way_merge, top_k
+from SkipList import SkipList
+from Trees import AVLTree, BinarySearchTree, SortedList
+
+
+def _timed(func, *args):
+    """
+    Calls func(*args) and returns (elapsed seconds, result).
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def _inputs(n):
+    """
+    Returns the sorted, reverse-sorted and random key orders used by the tree benchmarks.
+    """
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.shuffle(shuffled)
+    return {
+        "sorted": keys,
+        "reverse": keys[::-1],
+        "random": shuffled,
+    }
+
+
+def _build(tree_class, keys):
+    tree = tree_class()
+    insert = tree.insert
+    for key in keys:
+        insert(key)
+    return tree
+
+
+def _lookups(tree, probes):
+    contains = tree.contains
+    for key in probes:
+        contains(key)
+
+
+def benchmark_trees(n=10**6, bst_limit=10**4, probes=10**4):
+    """
+    Compares BinarySearchTree against AVLTree on sorted, reverse-sorted and random input.
+    Reports the tree height, build time and average contains() latency.
+    The unbalanced tree degenerates to O(n^2) build time on ordered input, so it is
+    only run with at most bst_limit keys on those orders.
+    """
+    print(f"{'tree':<18}{'order':<10}{'keys':>10}{'height':>10}{'build s':>10}{'lookup ns':>12}")
+    for order, keys in _inputs(n).items():
+        for tree_class in (BinarySearchTree, AVLTree):
+            data = keys
+            if tree_class is BinarySearchTree and order != "random":
+                data = keys[:bst_limit] if order == "sorted" else keys[-bst_limit:]
+            build_time, tree = _timed(_build, tree_class, data)
+            sample = random.sample(data, min(probes, len(data)))
+            lookup_time, _ = _timed(_lookups, tree, sample)
+            print(f"{tree_class.__name__:<18}{order:<10}{len(data):>10}{tree.height():>10}"
+                  f"{build_time:>10.3f}{lookup_time / len(sample) * 1e9:>12.0f}")
+
+
+def benchmark_bulk_load(n=10**6):
+    """
+    Compares building a tree with one insert per key against from_sorted bulk loading.
+    The insert loop uses random order for BinarySearchTree (sorted order would be O(n^2))
+    and sorted order for AVLTree.
+    """
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.shuffle(shuffled)
+    print(f"{'tree':<18}{'method':<14}{'keys':>10}{'height':>10}{'build s':>10}")
+    for tree_class, insert_keys in ((BinarySearchTree, shuffled), (AVLTree, keys)):
+        insert_time, tree = _timed(_build, tree_class, insert_keys)
+        print(f"{tree_class.__name__:<18}{'insert loop':<14}{n:>10}{tree.height():>10}{insert_time:>10.3f}")
+        bulk_time, tree = _timed(tree_class.from_sorted, keys)
+        print(f"{tree_class.__name__:<18}{'from_sorted':<14}{n:>10}{tree.height():>10}{bulk_time:>10.3f}")
+
+
+def _allocated(func, *args):
+    """
+    Calls func(*args) and returns (bytes still allocated afterwards, result).
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func(*args)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def _dict_node_class(node_class):
+    """
+    Returns a copy of node_class without __slots__, i.e. the node layout with a
+    per-instance __dict__ that the modules used before.
+    """
+    return type(node_class.__name__, (), {"__init__": node_class.__init__})
+
+
+def _fill_linked_list(values):
+    linked_list = LinkedList.LinkedList(values[0])
+    for value in values[1:]:
+        linked_list.append(value)
+    return linked_list
+
+
+def _fill(factory, method, values):
+    structure = factory()
+    add = getattr(structure, method)
+    for value in values:
+        add(value)
+    return structure
+
+
+def benchmark_node_memory(n=10**6):
+    """
+    Reports bytes per element for each node-based structure, with the
+    __slots__ node classes (after) and with dict-backed copies of them (before).
+    The values are created up front so only the structure itself is measured.
+    """
+    values = list(range(n))
+    shuffled = values[:]
+    random.shuffle(shuffled)
+    cases = [
+        ("LinkedList", LinkedList, NodeConstructor.Node, _fill_linked_list, (values,)),
+        ("LinkedList_cc", LinkedList_cc, NodeConstructor.Node, _fill, (LinkedList_cc.LinkedList, "append", values)),
+        ("DoublyLinkedList_cc", DoublyLinkedList_cc, NodeConstructor.DoublyNode, _fill,
+         (DoublyLinkedList_cc.DoublyLinkedList, "append", values)),
+        ("Stack", StackQueue, NodeConstructor.Node, _fill, (StackQueue.Stack, "push", values)),
+        ("Queue", StackQueue, NodeConstructor.Node, _fill, (StackQueue.Queue, "enqueue", values)),
+        ("BinarySearchTree", Trees, Trees.Node, _fill, (BinarySearchTree, "insert", shuffled)),
+    ]
+    print(f"{'structure':<22}{'elements':>10}{'before B/elem':>15}{'after B/elem':>14}")
+    for name, module, node_class, build, args in cases:
+        after, structure = _allocated(build, *args)
+        del structure
+        module.Node = _dict_node_class(node_class)
+        try:
+            before, structure = _allocated(build, *args)
+            del structure
+        finally:
+            module.Node = node_class
+        print(f"{name:<22}{n:>10}{before / n:>15.1f}{after / n:>14.1f}")
+
+
+def _scan(container):
+    for _ in container:
+        pass
+
+
+def benchmark_sorted_containers(n=10**6, probes=10**5):
+    """
+    Compares the pointer-based trees with the block-based SortedList on random
+    insertion, contains() lookups of present keys and a full in-order scan.
+    """
+    keys = list(range(n))
+    random.shuffle(keys)
+    sample = random.sample(keys, min(probes, n))
+    print(f"{'container':<18}{'keys':>10}{'build s':>10}{'lookup ns':>12}{'scan ns/key':>13}")
+    for container_class in (BinarySearchTree, AVLTree, SortedList):
+        build_time, container = _timed(_build, container_class, keys)
+        lookup_time, _ = _timed(_lookups, container, sample)
+        scan_time, _ = _timed(_scan, container)
+        print(f"{container_class.__name__:<18}{n:>10}{build_time:>10.3f}"
+              f"{lookup_time / len(sample) * 1e9:>12.0f}{scan_time / n * 1e9:>13.1f}")
+
+
+def _set_items(table, keys):
+    set_item = table.set_item
+    for key in keys:
+        set_item(key, key)
+
+
+def _get_items(table, keys):
+    get_item = table.get_item
+    for key in keys:
+        get_item(key)
+
+
+def benchmark_hash_table(max_n=10**7, fixed_limit=10**4):
+    """
+    Compares the resizing HashTable with the fixed 7-bucket table on set_item and
+    get_item throughput for 10^3 keys up to max_n keys. Every bucket of the fixed
+    table grows linearly with n, so it is only run up to fixed_limit keys.
+    """
+    print(f"{'table':<10}{'keys':>10}{'buckets':>10}{'set Mops/s':>12}{'get Mops/s':>12}")
+    n = 10**3
+    while n <= max_n:
+        keys = [f"key{i}" for i in range(n)]
+        for name, max_load_factor in (("resizing", 0.75), ("fixed", None)):
+            if max_load_factor is None and n > fixed_limit:
+                continue
+            table = HashTable(max_load_factor=max_load_factor)
+            set_time, _ = _timed(_set_items, table, keys)
+            get_time, _ = _timed(_get_items, table, keys)
+            print(f"{name:<10}{n:>10}{table.size:>10}{n / set_time / 1e6:>12.2f}{n / get_time / 1e6:>12.2f}")
+        n *= 10
+
+
+def _allocation_stats(func, *args):
+    """
+    Calls func(*args) and returns (bytes still allocated, number of live allocated blocks, result).
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func(*args)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return sum(stat.size_diff for stat in stats), sum(stat.count_diff for stat in stats), result
+
+
+def _filled_table(table_class, keys):
+    table = table_class()
+    _set_items(table, keys)
+    return table
+
+
+def benchmark_hash_table_engines(n=10**6):
+    """
+    Compares chaining (HashTable) with open addressing (OpenAddressingHashTable):
+    bytes and live allocations per entry after n inserts, and set/get throughput.
+    """
+    keys = [f"key{i}" for i in range(n)]
+    print(f"{'table':<26}{'keys':>10}{'B/entry':>10}{'allocs/entry':>14}{'set Mops/s':>12}{'get Mops/s':>12}")
+    for table_class in (HashTable, OpenAddressingHashTable):
+        size, blocks, table = _allocation_stats(_filled_table, table_class, keys)
+        del table
+        set_time, table = _timed(_filled_table, table_class, keys)
+        get_time, _ = _timed(_get_items, table, keys)
+        print(f"{table_class.__name__:<26}{n:>10}{size / n:>10.1f}{blocks / n:>14.2f}"
+              f"{n / set_time / 1e6:>12.2f}{n / get_time / 1e6:>12.2f}")
+
+
+def benchmark_hash_table_batch(n=10**6):
+    """
+    Compares set_many/get_many with a Python loop of set_item/get_item calls
+    on both hash table engines.
+    """
+    keys = [f"key{i}" for i in range(n)]
+    pairs = [(key, key) for key in keys]
+    print(f"{'table':<26}{'keys':>10}{'loop set':>10}{'set_many':>10}{'loop get':>10}{'get_many':>10}  (Mops/s)")
+    for table_class in (HashTable, OpenAddressingHashTable):
+        loop_set, table = _timed(_filled_table, table_class, keys)
+        loop_get, _ = _timed(_get_items, table, keys)
+        table = table_class()
+        batch_set, _ = _timed(table.set_many, pairs)
+        batch_get, _ = _timed(table.get_many, keys)
+        print(f"{table_class.__name__:<26}{n:>10}{n / loop_set / 1e6:>10.2f}{n / batch_set / 1e6:>10.2f}"
+              f"{n / loop_get / 1e6:>10.2f}{n / batch_get / 1e6:>10.2f}")
+
+
+class _GloballyLockedHashTable:
+    """
+    The baseline for benchmark_concurrent_hash_table: a HashTable behind one lock.
+    """
+    def __init__(self):
+        self.table = HashTable()
+        self.lock = threading.Lock()
+
+    def set_item(self, key, value):
+        with self.lock:
+            self.table.set_item(key, value)
+
+    def get_item(self, key):
+        with self.lock:
+            return self.table.get_item(key)
+
+    def delete_item(self, key):
+        with self.lock:
+            return self.table.delete_item(key)
+
+
+def _concurrent_worker(table, worker, ops, shared_keys, errors):
+    """
+    Writes, reads back and deletes keys owned by this worker, interleaved with
+    updates and reads of keys shared by all workers. Records any lost or wrong value.
+    """
+    own = [(worker, i) for i in range(ops // 4)]
+    for key in own:
+        table.set_item(key, key)
+    for i, key in enumerate(own):
+        shared = shared_keys[i % len(shared_keys)]
+        table.set_item(shared, worker)
+        table.get_item(shared)
+        if table.get_item(key) != key:
+            errors.append(key)
+    for key in own[::2]:
+        if not table.delete_item(key):
+            errors.append(key)
+
+
+def benchmark_concurrent_hash_table(ops=10**5, max_threads=16):
+    """
+    Stress test and throughput benchmark for ConcurrentHashTable against a HashTable
+    behind one global lock, with 1 up to max_threads threads each running ops operations.
+    After each run the table contents are checked: every key a thread kept must be present
+    with its value, every deleted key must be gone.
+    """
+    shared_keys = [f"shared{i}" for i in range(64)]
+    print(f"{'table':<28}{'threads':>8}{'Mops/s':>10}")
+    threads = 1
+    while threads <= max_threads:
+        for table_class in (_GloballyLockedHashTable, ConcurrentHashTable):
+            table = table_class()
+            errors = []
+            workers = [threading.Thread(target=_concurrent_worker, args=(table, worker, ops, shared_keys, errors))
+                       for worker in range(threads)]
+            start = time.perf_counter()
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+            for worker in range(threads):
+                for i in range(ops // 4):
+                    expected = None if i % 2 == 0 else (worker, i)
+                    if table.get_item((worker, i)) != expected:
+                        errors.append((worker, i))
+            if errors:
+                raise RuntimeError(f"{table_class.__name__} lost or corrupted {len(errors)} keys")
+            total_ops = threads * (ops // 4) * (4 + 1 / 2)
+            print(f"{table_class.__name__:<28}{threads:>8}{total_ops / elapsed / 1e6:>10.2f}")
+        threads *= 2
+
+
+def _open_and_probe(path, key):
+    table = DiskHashTable.open(path)
+    table.get_item(key)
+    return table
+
+
+def benchmark_disk_hash_table(n=10**6, probes=10**5):
+    """
+    Compares process start-up strategies for a table of n entries: re-inserting every
+    key into a HashTable versus opening a saved DiskHashTable (time to first lookup),
+    then the lookup throughput of both.
+    """
+    pairs = [(f"key{i}", i) for i in range(n)]
+    sample = [key for key, _ in random.sample(pairs, min(probes, n))]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.bin")
+        save_time, saved = _timed(DiskHashTable.save, pairs, path, 16, 24)
+        saved.close()
+
+        rebuild_time, table = _timed(_filled_table, HashTable, [key for key, _ in pairs])
+        open_time, disk_table = _timed(_open_and_probe, path, sample[0])
+        table_get, _ = _timed(_get_items, table, sample)
+        disk_get, _ = _timed(_get_items, disk_table, sample)
+        disk_table.close()
+        print(f"entries: {n}, file: {os.path.getsize(path) / 2**20:.1f} MiB, save: {save_time:.2f} s")
+        print(f"{'table':<16}{'startup ms':>12}{'lookup Mops/s':>15}")
+        print(f"{'HashTable':<16}{rebuild_time * 1e3:>12.1f}{len(sample) / table_get / 1e6:>15.2f}")
+        print(f"{'DiskHashTable':<16}{open_time * 1e3:>12.1f}{len(sample) / disk_get / 1e6:>15.2f}")
+
+
+def _scan_by_index(linked_list, n):
+    get = linked_list.get
+    for i in range(n):
+        get(i)
+
+
+def benchmark_linked_list_scan(n=10**6, index_limit=10**4):
+    """
+    Compares building a linked list with append versus from_iterable, and a full scan
+    with get(i) for every index versus the iterator. A get(i) scan is O(n^2), so it is
+    only run on the first index_limit elements and its full-list time is extrapolated.
+    """
+    values = list(range(n))
+    print(f"{'list':<20}{'elements':>10}{'append s':>10}{'from_iterable s':>17}{'get(i) scan s':>15}{'iter scan s':>13}")
+    for list_class in (LinkedList_cc.LinkedList, DoublyLinkedList_cc.DoublyLinkedList):
+        append_time, _ = _timed(_fill, list_class, "append", values)
+        build_time, linked_list = _timed(list_class.from_iterable, values)
+        limit = min(n, index_limit)
+        index_time, _ = _timed(_scan_by_index, linked_list, limit)
+        index_time *= (n / limit) ** 2
+        iter_time, _ = _timed(_scan, linked_list)
+        print(f"{list_class.__name__:<20}{n:>10}{append_time:>10.3f}{build_time:>17.3f}"
+              f"{index_time:>15.1f}{iter_time:>13.3f}")
+
+
+def _pop_all(linked_list, count):
+    pop = linked_list.pop
+    for _ in range(count):
+        pop()
+
+
+def benchmark_tail_pop(n=10**6, walk_limit=10**4):
+    """
+    Times popping every element from the tail: LinkedList_cc.LinkedList (walks to the
+    node before the tail, O(n) per pop), TrackedLinkedList (O(1)) and DoublyLinkedList (O(1)).
+    The walking list is only run with walk_limit elements.
+    """
+    print(f"{'list':<20}{'elements':>10}{'pop ns/op':>12}")
+    for list_class in (LinkedList_cc.LinkedList, LinkedList_cc.TrackedLinkedList, DoublyLinkedList_cc.DoublyLinkedList):
+        count = min(n, walk_limit) if list_class is LinkedList_cc.LinkedList else n
+        linked_list = list_class.from_iterable(range(count))
+        pop_time, _ = _timed(_pop_all, linked_list, count)
+        print(f"{list_class.__name__:<20}{count:>10}{pop_time / count * 1e9:>12.0f}")
+
+
+def _get_indices(linked_list, indices):
+    get = linked_list.get
+    for index in indices:
+        get(index)
+
+
+def benchmark_unrolled_linked_list(n=10**6, probes=10**3):
+    """
+    Compares LinkedList_cc.LinkedList (one node per value) with UnrolledLinkedList:
+    bytes per element, append throughput, random get(index) latency and a full scan.
+    """
+    values = list(range(n))
+    indices = [random.randrange(n) for _ in range(probes)]
+    print(f"{'list':<22}{'elements':>10}{'B/elem':>8}{'append ns':>11}{'get us':>9}{'scan ns':>9}")
+    for list_class in (LinkedList_cc.LinkedList, LinkedList_cc.UnrolledLinkedList):
+        size, linked_list = _allocated(_fill, list_class, "append", values)
+        del linked_list
+        append_time, linked_list = _timed(_fill, list_class, "append", values)
+        get_time, _ = _timed(_get_indices, linked_list, indices)
+        scan_time, _ = _timed(_scan, linked_list)
+        print(f"{list_class.__name__:<22}{n:>10}{size / n:>8.1f}{append_time / n * 1e9:>11.0f}"
+              f"{get_time / probes * 1e6:>9.1f}{scan_time / n * 1e9:>9.1f}")
+
+
+def _search_all(skip_list, values):
+    search = skip_list.search
+    for value in values:
+        search(value)
+
+
+def _reinsert_all(skip_list, values):
+    for value in values:
+        skip_list.remove(value)
+        skip_list.insert(value)
+
+
+def benchmark_skip_list(n=10**6, probes=10**3):
+    """
+    Builds a SkipList from n random values and compares its get(index) latency with
+    LinkedList_cc.LinkedList.get, plus search and remove+insert latency.
+    Prints the number of nodes on each level (expected n * p**level).
+    """
+    values = [random.random() for _ in range(n)]
+    indices = [random.randrange(n) for _ in range(probes)]
+    build_time, skip_list = _timed(SkipList.from_iterable, values)
+    linked_list = LinkedList_cc.LinkedList.from_iterable(sorted(values))
+    skip_get, _ = _timed(_get_indices, skip_list, indices)
+    list_get, _ = _timed(_get_indices, linked_list, indices)
+    sample = random.sample(values, probes)
+    search_time, _ = _timed(_search_all, skip_list, sample)
+    update_time, _ = _timed(_reinsert_all, skip_list, sample)
+    print(f"elements: {n}, build: {build_time:.2f} s, levels: {skip_list.level}")
+    print(f"{'operation':<34}{'us/op':>10}")
+    print(f"{'LinkedList_cc.get(i)':<34}{list_get / probes * 1e6:>10.2f}")
+    print(f"{'SkipList.get(i)':<34}{skip_get / probes * 1e6:>10.2f}")
+    print(f"{'SkipList.search(value)':<34}{search_time / probes * 1e6:>10.2f}")
+    print(f"{'SkipList.remove + insert':<34}{update_time / probes * 1e6:>10.2f}")
+    print("nodes per level:", skip_list.level_stats())
+
+
+def _sort_by_copy(linked_list):
+    values = sorted(linked_list)
+    current = linked_list.head
+    for value in values:
+        current.value = value
+        current = current.next
+
+
+def benchmark_linked_list_sort(n=10**6):
+    """
+    Compares LinkedList_cc.LinkedList.sort (in-place bottom-up merge sort) with copying
+    the values into a Python list, sorting it and writing them back, and times merge_sorted.
+    """
+    values = [random.random() for _ in range(n)]
+    linked_list = LinkedList_cc.LinkedList.from_iterable(values)
+    copy_time, _ = _timed(_sort_by_copy, linked_list)
+    linked_list = LinkedList_cc.LinkedList.from_iterable(values)
+    sort_time, _ = _timed(linked_list.sort)
+    other = LinkedList_cc.LinkedList.from_iterable(sorted(values))
+    merge_time, _ = _timed(linked_list.merge_sorted, other)
+    print(f"elements: {n}")
+    print(f"{'copy + sorted() + write back':<30}{copy_time:>8.2f} s")
+    print(f"{'LinkedList.sort':<30}{sort_time:>8.2f} s")
+    print(f"{'LinkedList.merge_sorted':<30}{merge_time:>8.2f} s  ({2 * n} nodes)")
+
+
+def benchmark_list_algorithms(max_n=10**7, min_n=10**5):
+    """
+    Times the in-place list algorithms (partition_list, reverse_between, swap_pairs and
+    remove_duplicates) of LinkedList_cc.LinkedList and DoublyLinkedList_cc.DoublyLinkedList
+    in ns per element, for min_n up to max_n elements. Each operation gets a fresh list.
+    """
+    singly = LinkedList_cc.LinkedList
+    doubly = DoublyLinkedList_cc.DoublyLinkedList
+    operations = (
+        (singly, "partition_list", lambda linked_list, n: linked_list.partition_list(n // 2)),
+        (singly, "reverse_between", lambda linked_list, n: linked_list.reverse_between(0, n - 1)),
+        (singly, "swap_pairs", lambda linked_list, n: linked_list.swap_pairs()),
+        (singly, "remove_duplicates", lambda linked_list, n: linked_list.remove_duplicates()),
+        (singly, "remove_duplicates sorted", lambda linked_list, n: linked_list.remove_duplicates(assume_sorted=True)),
+        (doubly, "partition_list", lambda linked_list, n: linked_list.partition_list(n // 2)),
+        (doubly, "swap_pairs", lambda linked_list, n: linked_list.swap_pairs()),
+    )
+    print(f"{'list':<18}{'operation':<26}{'elements':>10}{'ns/elem':>9}")
+    n = min_n
+    while n <= max_n:
+        values = [random.randrange(n // 2) for _ in range(n)]
+        for list_class, name, operation in operations:
+            source = sorted(values) if name.endswith("sorted") else values
+            linked_list = list_class.from_iterable(source)
+            elapsed, _ = _timed(operation, linked_list, n)
+            print(f"{list_class.__name__:<18}{name:<26}{n:>10}{elapsed / n * 1e9:>9.1f}")
+            del linked_list
+        n *= 10
+
+
+def _random_graph(n, degree):
+    return [[(random.randrange(n), random.random()) for _ in range(degree)] for _ in range(n)]
+
+
+def _dijkstra_lazy(graph):
+    """
+    Dijkstra with heapq: pushes a new (distance, node) entry on every improvement
+    and skips stale entries when they are popped.
+    """
+    distances = [float("inf")] * len(graph)
+    distances[0] = 0.0
+    heap = [(0.0, 0)]
+    peak = 1
+    while heap:
+        distance, node = heapq.heappop(heap)
+        if distance > distances[node]:
+            continue
+        for neighbour, weight in graph[node]:
+            candidate = distance + weight
+            if candidate < distances[neighbour]:
+                distances[neighbour] = candidate
+                heapq.heappush(heap, (candidate, neighbour))
+                if len(heap) > peak:
+                    peak = len(heap)
+    return distances, peak
+
+
+def _dijkstra_indexed(graph):
+    """
+    Dijkstra with IndexedMinHeap: one entry per node, improved with update_priority.
+    """
+    distances = [float("inf")] * len(graph)
+    distances[0] = 0.0
+    heap = IndexedMinHeap()
+    heap.insert(0, 0.0)
+    peak = 1
+    while len(heap) > 0:
+        node, distance = heap.pop()
+        for neighbour, weight in graph[node]:
+            candidate = distance + weight
+            if candidate < distances[neighbour]:
+                if distances[neighbour] == float("inf"):
+                    heap.insert(neighbour, candidate)
+                    if len(heap) > peak:
+                        peak = len(heap)
+                else:
+                    heap.update_priority(neighbour, candidate)
+                distances[neighbour] = candidate
+    return distances, peak
+
+
+def benchmark_indexed_heap(n=10**5, degree=16):
+    """
+    Runs Dijkstra's shortest paths on a random graph with n nodes and degree edges per node,
+    using heapq with lazy deletion versus IndexedMinHeap with decrease-key, and reports
+    the time and the largest heap size each one reached.
+    """
+    graph = _random_graph(n, degree)
+    lazy_time, (lazy_distances, lazy_peak) = _timed(_dijkstra_lazy, graph)
+    indexed_time, (indexed_distances, indexed_peak) = _timed(_dijkstra_indexed, graph)
+    assert lazy_distances == indexed_distances
+    print(f"nodes: {n}, edges: {n * degree}")
+    print(f"{'queue':<28}{'time s':>8}{'peak heap':>11}")
+    print(f"{'heapq + lazy deletion':<28}{lazy_time:>8.2f}{lazy_peak:>11}")
+    print(f"{'IndexedMinHeap':<28}{indexed_time:>8.2f}{indexed_peak:>11}")
+
+
+def _insert_all(heap, values):
+    insert = heap.insert
+    for value in values:
+        insert(value)
+
+
+def _insert_and_remove(heap, values):
+    for value in values:
+        heap.insert(value)
+        heap.remove()
+
+
+def _pushpop_all(heap, values):
+    pushpop = heap.pushpop
+    for value in values:
+        pushpop(value)
+
+
+def benchmark_heap_build(n=10**6, probes=10**5):
+    """
+    Compares building a MaxHeap with one insert per value against from_iterable
+    (Floyd's O(n) build), with heapq.heapify as a C reference, then times push_many
+    of n more values and pushpop against insert followed by remove.
+    """
+    values = [random.random() for _ in range(n)]
+    print(f"elements: {n}")
+    print(f"{'build (seconds)':<30}{'random':>8}{'ascending':>11}")
+    for name, build in (("MaxHeap insert per value", lambda data: _insert_all(MaxHeap(), data)),
+                        ("MaxHeap.from_iterable", MaxHeap.from_iterable),
+                        ("heapq.heapify", lambda data: heapq.heapify(list(data)))):
+        random_time, _ = _timed(build, values)
+        ascending_time, _ = _timed(build, sorted(values))
+        print(f"{name:<30}{random_time:>8.2f}{ascending_time:>11.2f}")
+
+    max_heap = MaxHeap.from_iterable(values)
+    batch_time, _ = _timed(max_heap.push_many, values)
+    sample = [random.random() for _ in range(probes)]
+    single_time, _ = _timed(_insert_and_remove, max_heap, sample)
+    pushpop_time, _ = _timed(_pushpop_all, max_heap, sample)
+    print(f"{'MaxHeap.push_many':<30}{batch_time:>8.2f} s  ({n} more values)")
+    print(f"{'insert + remove':<30}{single_time / probes * 1e6:>8.2f} us/op")
+    print(f"{'pushpop':<30}{pushpop_time / probes * 1e6:>8.2f} us/op")
+
+
+def _remove_all(heap, count):
+    remove = heap.remove
+    for _ in range(count):
+        remove()
+
+
+def _push_negated(heap, values):
+    heappush = heapq.heappush
+    for value in values:
+        heappush(heap, -value)
+
+
+def _pop_negated(heap, count):
+    heappop = heapq.heappop
+    for _ in range(count):
+        heappop(heap)
+
+
+def benchmark_heap_ops(n=10**6):
+    """
+    Insert and remove throughput (Mops/s) of MaxHeap (pure Python sifts) next to
+    MinHeap (heapq), plus heapq with negated values as a C-backed max-heap reference.
+    """
+    values = [random.random() for _ in range(n)]
+    print(f"elements: {n}")
+    print(f"{'heap':<22}{'insert Mops/s':>15}{'remove Mops/s':>15}")
+    for heap_class in (MaxHeap, MinHeap):
+        heap = heap_class()
+        insert_time, _ = _timed(_insert_all, heap, values)
+        remove_time, _ = _timed(_remove_all, heap, n)
+        print(f"{heap_class.__name__:<22}{n / insert_time / 1e6:>15.2f}{n / remove_time / 1e6:>15.2f}")
+    heap = []
+    insert_time, _ = _timed(_push_negated, heap, values)
+    remove_time, _ = _timed(_pop_negated, heap, n)
+    print(f"{'heapq, negated values':<22}{n / insert_time / 1e6:>15.2f}{n / remove_time / 1e6:>15.2f}")
+
+
+def _push_tuples(heap, records):
+    heappush = heapq.heappush
+    for counter, record in enumerate(records):
+        heappush(heap, (record[0], counter, record))
+
+
+def _pop_tuples(heap, count):
+    heappop = heapq.heappop
+    for _ in range(count):
+        heappop(heap)
+
+
+def benchmark_heap_keys(n=10**6):
+    """
+    Stable priority queues of records ordered by their first field: heapq with
+    (priority, counter, record) tuples versus MinHeap and MaxHeap with key= and stable=True,
+    which keep keys and counters in parallel lists. Reports Mops/s and the bytes allocated.
+    """
+    records = [(random.randrange(100), i) for i in range(n)]
+    key = lambda record: record[0]
+    print(f"records: {n}")
+    print(f"{'queue':<30}{'insert Mops/s':>15}{'remove Mops/s':>15}{'B/record':>10}")
+    heap = []
+    size, _ = _allocated(_push_tuples, heap, records)
+    heap = []
+    insert_time, _ = _timed(_push_tuples, heap, records)
+    remove_time, _ = _timed(_pop_tuples, heap, n)
+    print(f"{'heapq + tuples':<30}{n / insert_time / 1e6:>15.2f}{n / remove_time / 1e6:>15.2f}{size / n:>10.1f}")
+    for heap_class in (MinHeap, MaxHeap):
+        heap = heap_class(key=key, stable=True)
+        size, _ = _allocated(_insert_all, heap, records)
+        heap = heap_class(key=key, stable=True)
+        insert_time, _ = _timed(_insert_all, heap, records)
+        remove_time, _ = _timed(_remove_all, heap, n)
+        name = f"{heap_class.__name__}(key, stable)"
+        print(f"{name:<30}{n / insert_time / 1e6:>15.2f}{n / remove_time / 1e6:>15.2f}{size / n:>10.1f}")
+
+
+def _consume(iterator):
+    for _ in iterator:
+        pass
+
+
+def benchmark_streaming(n=10**6, k=100, shards=16):
+    """
+    Times top_k over a stream of n values against heapq.nlargest and sorting everything,
+    and k_way_merge of sorted shards against heapq.merge. A second, traced run reports the
+    peak memory of each (the inputs are generators, so only the utilities allocate).
+    """
+    def stream():
+        return (random.random() for _ in range(n))
+
+    def sorted_shards():
+        per_shard = n // shards
+        return [(shard + i * shards for i in range(per_shard)) for shard in range(shards)]
+
+    print(f"values: {n}, k: {k}, shards: {shards}")
+    print(f"{'operation':<26}{'time s':>8}{'peak KiB':>10}")
+    for name, func in (("top_k", lambda: top_k(stream(), k)),
+                       ("heapq.nlargest", lambda: heapq.nlargest(k, stream())),
+                       ("sorted()[:k]", lambda: sorted(stream(), reverse=True)[:k]),
+                       ("k_way_merge", lambda: _consume(k_way_merge(*sorted_shards()))),
+                       ("heapq.merge", lambda: _consume(heapq.merge(*sorted_shards())))):
+        elapsed, _ = _timed(func)
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        print(f"{name:<26}{elapsed:>8.2f}{peak / 1024:>10.0f}")
+
+
+BENCHMARKS = {
+    "trees": benchmark_trees,
+    "bulk_load": benchmark_bulk_load,
+    "node_memory": benchmark_node_memory,
+    "sorted_containers": benchmark_sorted_containers,
+    "hash_table": benchmark_hash_table,
+    "hash_table_engines": benchmark_hash_table_engines,
+    "hash_table_batch": benchmark_hash_table_batch,
+    "concurrent_hash_table": benchmark_concurrent_hash_table,
+    "disk_hash_table": benchmark_disk_hash_table,
+    "linked_list_scan": benchmark_linked_list_scan,
+    "tail_pop": benchmark_tail_pop,
+    "unrolled_linked_list": benchmark_unrolled_linked_list,
+    "skip_list": benchmark_skip_list,
+    "linked_list_sort": benchmark_linked_list_sort,
+    "list_algorithms": benchmark_list_algorithms,
+    "indexed_heap": benchmark_indexed_heap,
+    "heap_build": benchmark_heap_build,
+    "heap_ops": benchmark_heap_ops,
+    "heap_keys": benchmark_heap_keys,
+    "streaming": benchmark_streaming,
+}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        name = sys.argv[1]
+        sizes = [int(arg) for arg in sys.argv[2:]]
+        BENCHMARKS[name](*sizes)
+    else:
+        benchmark_trees(n=10**4, bst_limit=2000)
+        benchmark_bulk_load(n=10**4)
+        benchmark_node_memory(n=10**4)
+        benchmark_sorted_containers(n=10**4, probes=10**4)
+        benchmark_hash_table(max_n=10**4)
+        benchmark_hash_table_engines(n=10**4)
+        benchmark_hash_table_batch(n=10**4)
+        benchmark_concurrent_hash_table(ops=10**4, max_threads=4)
+        benchmark_disk_hash_table(n=10**4, probes=10**4)
+        benchmark_linked_list_scan(n=10**4, index_limit=2000)
+        benchmark_tail_pop(n=10**4, walk_limit=2000)
+        benchmark_unrolled_linked_list(n=10**4, probes=100)
+        benchmark_skip_list(n=10**4, probes=100)
+        benchmark_linked_list_sort(n=10**4)
+        benchmark_list_algorithms(max_n=10**4, min_n=10**4)
+        benchmark_indexed_heap(n=10**4)
+        benchmark_heap_build(n=10**4, probes=10**4)
+        benchmark_heap_ops(n=10**4)
+        benchmark_heap_keys(n=10**4)
+        benchmark_streaming(n=10**4, k=10, shards=4)
@@ -0,0 +1,223 @@
+"""
+A bounded key-value cache built from HashTables.HashTable and DoublyLinkedList_cc.DoublyLinkedList.
+Terminology:
+- Hit / Miss: A lookup that finds / does not find its key in the cache.
+- Eviction: Removing an entry to make room when the cache is full.
+- LRU (least recently used): Evicts the entry that was accessed longest ago.
+- LFU (least frequently used): Evicts the entry with the fewest accesses; ties are broken by recency.
+How it works:
+- The hash table maps each key to its entry, which is itself a doubly linked list node,
+  so lookups and reordering are O(1) with no index walks.
+- LRU keeps one list ordered from most to least recently used.
+- LFU keeps a list of frequency buckets in ascending frequency order; each bucket holds a
+  list of entries ordered by recency. The least frequently used entry is the tail of the first bucket.
+"""
+
+import sys
+
+from DoublyLinkedList_cc import DoublyLinkedList, Node
+from HashTables import HashTable
+
+
+class _Entry(Node):
+    """
+    A cache entry: a doubly linked list node holding the cached value,
+    its key, its size in bytes and (for LFU) the frequency bucket it belongs to.
+    """
+    __slots__ = ("key", "size", "bucket")
+
+    def __init__(self, key, value, size):
+        super().__init__(value)
+        self.key = key
+        self.size = size
+        self.bucket = None
+
+
+class _Bucket(Node):
+    """
+    An LFU frequency bucket: a node whose value is the list of entries accessed frequency times.
+    """
+    __slots__ = ("frequency",)
+
+    def __init__(self, frequency):
+        super().__init__(DoublyLinkedList())
+        self.frequency = frequency
+
+
+class Cache:
+    """
+    A bounded cache with LRU or LFU eviction.
+    get and put run in O(1). The cache can be bounded by number of entries,
+    by total size in bytes, or both, and counts hits, misses and evictions.
+    """
+    def __init__(self, max_entries=None, max_bytes=None, policy="lru", sizeof=sys.getsizeof):
+        """
+        :param max_entries: The maximum number of entries (at least 1), or None for no limit.
+        :param max_bytes: The maximum total size of the cached values, or None for no limit.
+        :param policy: "lru" or "lfu".
+        :param sizeof: The function used to measure a value's size in bytes when max_bytes is set.
+        """
+        if policy not in ("lru", "lfu"):
+            raise ValueError("policy must be 'lru' or 'lfu'")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.sizeof = sizeof
+        self.entries = HashTable()
+        self.order = DoublyLinkedList()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def stats(self):
+        """
+        Returns the hit, miss and eviction counters and the current usage.
+        :return: A dict of counters.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+        }
+
+    def get(self, key, default=None):
+        """
+        Returns the value cached for key and marks it as used, or default on a miss.
+        :param key: The key to look up.
+        :param default: The value returned when the key is not cached.
+        """
+        entry = self.entries.get_item(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.__touch(entry)
+        return entry.value
+
+    def put(self, key, value):
+        """
+        Caches value under key, evicting other entries as needed to stay within the limits.
+        :param key: The key to store.
+        :param value: The value to cache.
+        :return: True if the value was cached, False if it alone exceeds max_bytes.
+        """
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return False
+
+        entry = self.entries.get_item(key)
+        if entry is not None:
+            self.bytes += size - entry.size
+            entry.value = value
+            entry.size = size
+            self.__touch(entry)
+            while self.__over_limit(0, 0):
+                self.__evict(entry)
+            return True
+
+        while len(self.entries) > 0 and self.__over_limit(1, size):
+            self.__evict(None)
+
+        entry = _Entry(key, value, size)
+        self.entries.set_item(key, entry)
+        self.bytes += size
+        if self.policy == "lru":
+            self.order.prepend_node(entry)
+        else:
+            bucket = self.order.head
+            if bucket is None or bucket.frequency != 1:
+                bucket = _Bucket(1)
+                self.order.prepend_node(bucket)
+            entry.bucket = bucket
+            bucket.value.prepend_node(entry)
+        return True
+
+    def delete(self, key):
+        """
+        Removes key from the cache.
+        :param key: The key to remove.
+        :return: True if the key was cached, False otherwise.
+        """
+        entry = self.entries.get_item(key)
+        if entry is None:
+            return False
+        self.__remove(entry)
+        return True
+
+    def __over_limit(self, extra_entries, extra_bytes):
+        if self.max_entries is not None and len(self.entries) + extra_entries > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.bytes + extra_bytes > self.max_bytes
+
+    def __touch(self, entry):
+        """
+        Records an access to entry: moves it to the front of the LRU list, or
+        into the next frequency bucket for LFU.
+        """
+        if self.policy == "lru":
+            self.order.move_to_front(entry)
+            return
+
+        bucket = entry.bucket
+        frequency = bucket.frequency + 1
+        target = bucket.next
+        if target is None or target.frequency != frequency:
+            target = _Bucket(frequency)
+            self.order.insert_node_after(bucket, target)
+        bucket.value.remove_node(entry)
+        target.value.prepend_node(entry)
+        entry.bucket = target
+        if bucket.value.length == 0:
+            self.order.remove_node(bucket)
+
+    def __evict(self, keep):
+        """
+        Evicts the least recently (LRU) or least frequently (LFU) used entry other than keep.
+        """
+        if self.policy == "lru":
+            victim = self.order.tail
+            if victim is keep:
+                victim = victim.prev
+        else:
+            bucket = self.order.head
+            victim = bucket.value.tail
+            if victim is keep:
+                victim = victim.prev if victim.prev is not None else bucket.next.value.tail
+        self.__remove(victim)
+        self.evictions += 1
+
+    def __remove(self, entry):
+        if self.policy == "lru":
+            self.order.remove_node(entry)
+        else:
+            bucket = entry.bucket
+            bucket.value.remove_node(entry)
+            if bucket.value.length == 0:
+                self.order.remove_node(bucket)
+            entry.bucket = None
+        self.entries.delete_item(entry.key)
+        self.bytes -= entry.size
+
+
+if __name__ == "__main__":
+    cache = Cache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)  # evicts "b", the least recently used
+    print("b" in cache, cache.get("a"), cache.get("c"))  # Output: False 1 3
+    print(cache.stats())
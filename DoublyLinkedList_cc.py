@@ -1,8 +1,5 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
-        self.prev = None
+from NodeConstructor import DoublyNode as Node
+
 
 class DoublyLinkedList:
     """ 
@@ -16,6 +13,69 @@ class DoublyLinkedList:
         self.tail = None
         self.length = 0
     
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Builds a doubly linked list from the values of an iterable in one pass.
+        :param iterable: The values to add, in order.
+        :return: The new list.
+        :rtype: DoublyLinkedList
+        """
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """
+        Iterates over the values of the list from head to tail.
+        """
+        node = self.head
+        while node is not None:
+            yield node.value
+            node = node.next
+
+    def __reversed__(self):
+        """
+        Iterates over the values of the list from tail to head.
+        """
+        node = self.tail
+        while node is not None:
+            yield node.value
+            node = node.prev
+
+    def extend(self, iterable):
+        """
+        Appends every value of an iterable to the end of the list.
+        The nodes are linked in a single loop without calling append per value.
+        :param iterable: The values to add, in order.
+        """
+        if iterable is self:
+            iterable = list(self)
+
+        values = iter(iterable)
+        tail = self.tail
+        count = 0
+        if tail is None:
+            for value in values:
+                tail = self.head = Node(value)
+                count = 1
+                break
+            else:
+                return
+
+        for value in values:
+            node = Node(value)
+            node.prev = tail
+            tail.next = node
+            tail = node
+            count += 1
+
+        self.tail = tail
+        self.length += count
+
     def print_list(self):
         """
         Method to print DoublyLinkedList values
@@ -144,14 +204,7 @@ class DoublyLinkedList:
             self.append(value)
             return True
 
-        node = Node(value)
-        current = self.get(index)
-
-        current.prev.next = node
-        node.prev = current.prev
-        node.next = current
-        current.prev = node
-        self.length += 1
+        self.insert_before(self.get(index), value)
         return True
     
     def remove(self, index):
@@ -169,14 +222,93 @@ class DoublyLinkedList:
         elif index == self.length - 1:
             return self.pop()
 
-        node = self.get(index)
-        node.prev.next = node.next
-        node.next.prev = node.prev
+        return self.remove_node(self.get(index))
+
+    def insert_after(self, node, value):
+        """
+        Inserts a new node with the given value right after a node of this list in O(1).
+        :param node: A node that belongs to this list.
+        :param value: The value of the new node.
+        :return: The new node.
+        :rtype: Node
+        """
+        new_node = Node(value)
+        self.insert_node_after(node, new_node)
+        return new_node
+
+    def insert_before(self, node, value):
+        """
+        Inserts a new node with the given value right before a node of this list in O(1).
+        :param node: A node that belongs to this list.
+        :param value: The value of the new node.
+        :return: The new node.
+        :rtype: Node
+        """
+        new_node = Node(value)
+        if node.prev is None:
+            self.prepend_node(new_node)
+        else:
+            self.insert_node_after(node.prev, new_node)
+        return new_node
+
+    def insert_node_after(self, anchor, node):
+        """
+        Links an existing, detached node right after anchor in O(1).
+        :param anchor: A node that belongs to this list.
+        :param node: The node to link.
+        """
+        node.prev = anchor
+        node.next = anchor.next
+        if anchor.next is None:
+            self.tail = node
+        else:
+            anchor.next.prev = node
+        anchor.next = node
+        self.length += 1
+
+    def prepend_node(self, node):
+        """
+        Links an existing, detached node at the start of the list in O(1).
+        :param node: The node to link.
+        """
+        node.prev = None
+        node.next = self.head
+        if self.head is None:
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
+        self.length += 1
+
+    def remove_node(self, node):
+        """
+        Unlinks a node of this list in O(1), without searching for it.
+        :param node: A node that belongs to this list.
+        :return: The removed node.
+        :rtype: Node
+        """
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
         node.next = None
         node.prev = None
 
         self.length -= 1
         return node
+
+    def move_to_front(self, node):
+        """
+        Moves a node of this list to the start of the list in O(1).
+        :param node: A node that belongs to this list.
+        """
+        if node is not self.head:
+            self.remove_node(node)
+            self.prepend_node(node)
     
     def is_palindrome(self):
         """        
@@ -242,102 +374,59 @@ class DoublyLinkedList:
 
     def partition_list(self, x):
         """
-        #   +===================================================+
-        #   |               WRITE YOUR CODE HERE                |
-        #   | Description:                                      |
-        #   | - Partitions a doubly linked list around a value  |
-        #   |   `x`.                                            |
-        #   | - All nodes with values less than `x` come before |
-        #   |   nodes with values greater than or equal to `x`. |
-        #   |                                                   |
-        #   | Behavior:                                         |
-        #   | - Uses two dummy nodes to create two sublists:    |
-        #   |   one for nodes < x, and one for nodes >= x.      |
-        #   | - Each node is added to the appropriate sublist   |
-        #   |   while maintaining both next and prev pointers.  |
-        #   | - The sublists are then joined together.          |
-        #   | - The head of the list is updated to the start of |
-        #   |   the merged result.                              |
-        #   +===================================================+
-        
-        # if self.length <= 1:
-        #     return
-        
-        # dummy_1 = Node(0)
-        # dummy_2 = Node(0)
-        
-        # node_l = dummy_1
-        # node_r = dummy_2
-        # current = self.head
-        
-        # while current:
-        #     if current.value < x:
-        #         node_l.next = current
-        #         current.prev = node_l
-        #         node_l = current
-        #     else:
-        #         node_r.next = current
-        #         current.prev = node_r
-        #         node_r = current
-                
-        #     current = current.next
-
-        # if dummy_1.next and dummy_2.next:    
-        #     self.head = dummy_1.next
-            
-        #     node_l.next = dummy_2.next
-        #     dummy_2.next.prev = node_l
-
-        # self.head.prev = node_r.next = dummy_1.next = dummy_2.next = None
-
+        Partitions the doubly linked list around a value `x`: all nodes with values less than `x`
+        come before nodes with values greater than or equal to `x`, each part keeping its order.
         :param x: The value around which to partition the list.
         :type x: int
         :return: None
         :rtype: None
         logic
         1. If the list is empty or has one element, no action is needed.
-        2. Initialize two dummy nodes to create two sublists:
+        2. Traverse the list once, appending each node to one of two chains:
             - One for nodes with values less than `x`.
             - One for nodes with values greater than or equal to `x`.
-        3. Traverse the list:
-            a. If the current node's value is less than `x`, add it to the first sublist.
-            b. If the current node's value is greater than or equal to `x`, add it to the second sublist.
-            c. Maintain both next and prev pointers for each node.
-        4. After traversing the list, connect the two sublists:
-            a. Set the next pointer of the last node in the first sublist to the head of the second sublist.
-            b. Set the prev pointer of the head of the second sublist to the last node of the first sublist if it exists.
-        5. Update the head of the  list to the start of the merged result.
-        6. Set the next pointer of the last node in the second sublist to None
-        7. Set the prev pointer of the head of the list to None.
+           Each chain is tracked by its own head and tail (no dummy nodes),
+           and both next and prev pointers are maintained as nodes are appended.
+        3. Connect the tail of the first chain to the head of the second chain.
+        4. Update the head and tail of the list.
+        5. Set the prev pointer of the head and the next pointer of the tail to None.
+        Single pass, O(1) extra space and no allocations.
         """
-        if not self.head:
-            return None
-    
-        dummy1 = Node(0)
-        dummy2 = Node(0)
-        prev1 = dummy1
-        prev2 = dummy2
+        if self.length <= 1:
+            return
+
+        less_head = less_tail = None
+        more_head = more_tail = None
         current = self.head
-    
+
         while current:
             if current.value < x:
-                prev1.next = current
-                current.prev = prev1
-                prev1 = current
-                
+                if less_tail is None:
+                    less_head = current
+                else:
+                    less_tail.next = current
+                current.prev = less_tail
+                less_tail = current
             else:
-                prev2.next = current
-                current.prev = prev2
-                prev2 = current
+                if more_tail is None:
+                    more_head = current
+                else:
+                    more_tail.next = current
+                current.prev = more_tail
+                more_tail = current
             current = current.next
-        
-        prev1.next = dummy2.next
-        if dummy2.next:
-            dummy2.next.prev = prev1
-        prev2.next = None
-        
-        self.head = dummy1.next
+
+        if less_tail is None:
+            self.head, self.tail = more_head, more_tail
+        elif more_tail is None:
+            self.head, self.tail = less_head, less_tail
+        else:
+            less_tail.next = more_head
+            more_head.prev = less_tail
+            self.head, self.tail = less_head, more_tail
+
         self.head.prev = None
+        self.tail.next = None
 
     def swap_pairs(self):
         """        
@@ -347,86 +436,43 @@ class DoublyLinkedList:
         logic
         1. If the list has less than two nodes, no action is needed.
         2. Initialize pointers:
-            - pre_item as None (to track the previous node).
-            - item_1 as the head (first node).
-            - item_2 as the second node (head.next).
-        3. Update the head to the second node (item_2).
-        4. Iterate through the list:
-            a. Store the next nodes:
-                - next_item_1 as item_2.next (the node after item_2).
-                - next_item_2 as next_item_1.next (the node after next_item_1).
-            b. If next_item_1 exists, set next_item_2 to next_item
-            c. If next_item_2 is None, set post_item to next_item_1.
-            d. Set item_2's next to item_1 and prev to pre_item.
-            e. Set item_1's next to post_item and prev to item_2.
-            f. Update pre_item to item_1.
-            g. Move item_1 and item_2 to the next pair of nodes.
-        5. The list is now modified in place with every two adjacent nodes swapped.
-
+            - previous as None (the last node of the previous swapped pair).
+            - first as the head (first node of the current pair).
+        3. While first and first.next exist:
+            a. Let second be first.next and following be the node after the pair.
+            b. Link previous (or the head) to second, second to first and first to following,
+               fixing the prev pointers of second, first and following.
+            c. Move previous to first and first to following.
+        4. Update the tail: the unpaired last node if the length is odd, otherwise previous.
+        The list is modified in place with every two adjacent nodes swapped, in a single pass
+        without dummy nodes.
         """
         
         if self.length < 2:
             return
-        
-        pre_item = None
-        item_1 = self.head
-        item_2 = self.head.next
-        self.head = item_2
-        
-        while item_1 and item_2:
-            next_item_1 = item_2.next
-            if next_item_1:
-                next_item_2 = next_item_1.next
+
+        previous = None
+        first = self.head
+
+        while first and first.next:
+            second = first.next
+            following = second.next
+
+            if previous is None:
+                self.head = second
             else:
-                next_item_2 = None
-                
-            post_item = next_item_2 or next_item_1
-            
-            item_2.next = item_1
-            item_2.prev = pre_item
-            
-            item_1.next = post_item
-            item_1.prev = item_2
-            
-            pre_item = item_1
-            item_1, item_2 = next_item_1, next_item_2
+                previous.next = second
+            second.prev = previous
+            second.next = first
+            first.prev = second
+            first.next = following
+            if following:
+                following.prev = first
 
-        # Best approach using dummy nodes
-        # This is a more efficient way to swap pairs using dummy nodes.
+            previous = first
+            first = following
 
-        # if self.length < 2:
-        #     return
-    
-        # dummy = Node(0)
-        # dummy.next = self.head
-        # self.head.prev = dummy
-        
-        # prev = dummy
-        
-        # while prev.next and prev.next.next:
-        #     # Nodes to be swapped
-        #     first = prev.next
-        #     second = prev.next.next
-            
-        #     # Store next pair
-        #     next_pair = second.next
-            
-        #     # Perform swap
-        #     prev.next = second
-        #     second.prev = prev
-        #     second.next = first
-        #     first.prev = second
-        #     first.next = next_pair
-            
-        #     if next_pair:
-        #         next_pair.prev = first
-            
-        #     # Move to next pair
-        #     prev = first
-        
-        # # Update head
-        # self.head = dummy.next
-        # self.head.prev = None
+        self.tail = first or previous
         
         
 if __name__ == "__main__":
@@ -5,17 +5,79 @@ Terminology:
 - Hash Function: A function that converts a key into an index in the hash table.
 - Collision: When two keys hash to the same index.
 - Load Factor: The ratio of the number of elements to the size of the hash table.
+- Rehashing: Growing (or shrinking) the table and reinserting every key, done when the load factor crosses a threshold.
 - Chaining: A collision resolution strategy that uses linked lists to store multiple values at the same index.
 - Open Addressing: A collision resolution strategy that finds another open slot in the hash table.
+- Linear Probing: An open addressing scheme that tries the following slots one by one until a free one is found.
+- Tombstone: A marker left in a deleted open addressing slot so that probe sequences passing through it are not cut short.
+- Lock Striping: Splitting a table into independently locked parts so threads working on different parts do not block each other.
+- Memory-mapped file: A file mapped into the address space, so its pages are loaded lazily and shared between processes.
 """
 
-class HashTable:
+import hashlib
+import mmap
+import pickle
+import struct
+import threading
+from array import array
+from collections.abc import ItemsView, Mapping, MutableMapping, ValuesView
+
+_EMPTY = object()
+_DELETED = object()
+# Fibonacci hashing for OpenAddressingHashTable: the hash times 2^64 / golden ratio,
+# of which the top bits pick the first slot, so keys that differ only in high bits spread out.
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+class _ValuesView(ValuesView):
+    """
+    A lazy view of a hash table's values that walks the table directly
+    instead of looking every key up again.
+    """
+    def __iter__(self):
+        for _, value in self._mapping._iter_items():
+            yield value
+
+
+class _ItemsView(ItemsView):
+    """
+    A lazy view of a hash table's (key, value) pairs that walks the table directly.
+    """
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class HashTable(MutableMapping):
     """
     A simple hash table implementation using chaining for collision resolution.
+    The table grows (roughly doubling) whenever the load factor exceeds max_load_factor,
+    which keeps the buckets short and gives amortized O(1) inserts.
+    It implements the MutableMapping protocol (table[key], del table[key], len, in,
+    iteration); keys(), values() and items() are lazy views that copy nothing.
     """
-    def __init__(self, size=7):
+    def __init__(self, size=7, max_load_factor=0.75, min_load_factor=None):
+        """
+        Args:
+            size: The initial number of buckets.
+            max_load_factor: The load factor above which the table grows; must be positive.
+                None keeps the table at a fixed size.
+            min_load_factor: The load factor below which delete_item shrinks the table
+                (never below the initial size). None disables shrinking. Must be below
+                max_load_factor / 2, since growing roughly doubles the size and halves the load.
+        """
+        if max_load_factor is not None and max_load_factor <= 0:
+            raise ValueError("max_load_factor must be positive")
+        if (min_load_factor is not None and max_load_factor is not None
+                and not 0 <= min_load_factor < max_load_factor / 2):
+            raise ValueError("min_load_factor must be between 0 and max_load_factor / 2")
+
         self.size = size
         self.data_map = [None] * size
+        self.count = 0
+        self.initial_size = size
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
 
     def __hash(self, key):
         """        
@@ -33,6 +95,31 @@ class HashTable:
         """
         return hash(key) % self.size
 
+    def load_factor(self):
+        """
+        Returns the current load factor (number of entries per bucket).
+        """
+        return self.count / self.size
+
+    def resize(self, size):
+        """
+        Rehashes every entry into a table with the given number of buckets.
+        The existing [key, value] entries are moved, not copied.
+        Args:
+            size: The new number of buckets.
+        """
+        data_map = [None] * size
+        for bucket in self.data_map:
+            if bucket is not None:
+                for kv in bucket:
+                    index = hash(kv[0]) % size
+                    if data_map[index] is None:
+                        data_map[index] = [kv]
+                    else:
+                        data_map[index].append(kv)
+        self.size = size
+        self.data_map = data_map
+
     def set_item(self, key, value):
         """
         Inserts or updates a key-value pair in the hash table.
@@ -52,6 +139,9 @@ class HashTable:
                 return
             
         self.data_map[index].append([key, value])
+        self.count += 1
+        if self.max_load_factor is not None and self.count > self.size * self.max_load_factor:
+            self.resize(2 * self.size + 1)
 
     def get_item(self, key):
         """
@@ -69,16 +159,871 @@ class HashTable:
                 if kv[0] == key:
                     return kv[1]
         return None
+
+    def delete_item(self, key):
+        """
+        Removes a key and its value from the hash table.
+        Shrinks the table when min_load_factor is set and the load factor falls below it.
+        Args:
+            key: The key to remove.
+        Returns:
+            bool: True if the key was removed, False if it does not exist.
+        """
+        index = self.__hash(key)
+        bucket = self.data_map[index]
+        if bucket is None:
+            return False
+
+        for i, kv in enumerate(bucket):
+            if kv[0] == key:
+                del bucket[i]
+                if not bucket:
+                    self.data_map[index] = None
+                self.count -= 1
+                if (self.min_load_factor is not None and self.size > self.initial_size
+                        and self.count < self.size * self.min_load_factor):
+                    # Only shrink if the smaller table keeps a quarter of max_load_factor as
+                    # headroom, so a constant fraction of n operations separates any two
+                    # resizes, even when min_load_factor is close to max_load_factor / 2.
+                    size = max(self.initial_size, (self.size - 1) // 2)
+                    if self.max_load_factor is None or self.count < size * self.max_load_factor * 0.75:
+                        self.resize(size)
+                return True
+        return False
     
-    def keys(self):
+    def reserve(self, count):
+        """
+        Grows the table once so that it can hold count entries without exceeding
+        max_load_factor. Does nothing for a fixed-size table.
+        Args:
+            count: The number of entries the table should hold.
+        """
+        if self.max_load_factor is None:
+            return
+        size = self.size
+        while count > size * self.max_load_factor:
+            size = 2 * size + 1
+        if size != self.size:
+            self.resize(size)
+
+    def set_many(self, pairs):
         """
-        Returns a list of all keys in the hash table.
+        Inserts or updates many key-value pairs at once.
+        The table is resized at most once up front, and the loop works on local
+        variables instead of calling set_item for every pair.
+        Args:
+            pairs: A mapping or an iterable of (key, value) pairs.
+        """
+        if isinstance(pairs, Mapping):
+            pairs = pairs.items()
+        elif not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+        self.reserve(self.count + len(pairs))
+
+        data_map = self.data_map
+        size = self.size
+        added = 0
+        for key, value in pairs:
+            index = hash(key) % size
+            bucket = data_map[index]
+            if bucket is None:
+                data_map[index] = [[key, value]]
+                added += 1
+                continue
+            for kv in bucket:
+                if kv[0] == key:
+                    kv[1] = value
+                    break
+            else:
+                bucket.append([key, value])
+                added += 1
+        self.count += added
+
+    def get_many(self, keys, default=None):
+        """
+        Retrieves the values of many keys at once.
+        Args:
+            keys: An iterable of keys.
+            default: The value returned for keys that do not exist.
         Returns:
-            list: A list of keys in the hash table.
+            list: The values, in the order of keys.
         """
-        keys = []
+        data_map = self.data_map
+        size = self.size
+        values = []
+        append = values.append
+        for key in keys:
+            bucket = data_map[hash(key) % size]
+            if bucket is not None:
+                for kv in bucket:
+                    if kv[0] == key:
+                        append(kv[1])
+                        break
+                else:
+                    append(default)
+            else:
+                append(default)
+        return values
+
+    def __getitem__(self, key):
+        bucket = self.data_map[self.__hash(key)]
+        if bucket is not None:
+            for kv in bucket:
+                if kv[0] == key:
+                    return kv[1]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        self.set_item(key, value)
+
+    def __delitem__(self, key):
+        if not self.delete_item(key):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        bucket = self.data_map[self.__hash(key)]
+        if bucket is not None:
+            for kv in bucket:
+                if kv[0] == key:
+                    return True
+        return False
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for bucket in self.data_map:
+            if bucket is not None:
+                for kv in bucket:
+                    yield kv[0]
+
+    def _iter_items(self):
         for bucket in self.data_map:
             if bucket is not None:
                 for kv in bucket:
-                    keys.append(kv[0])
-        return keys
+                    yield kv[0], kv[1]
+
+    def values(self):
+        """
+        Returns a lazy view of the values in the hash table.
+        """
+        return _ValuesView(self)
+
+    def items(self):
+        """
+        Returns a lazy view of the (key, value) pairs in the hash table.
+        """
+        return _ItemsView(self)
+
+    def clear(self):
+        """
+        Removes every entry and returns the table to its initial size.
+        """
+        self.size = self.initial_size
+        self.data_map = [None] * self.size
+        self.count = 0
+
+
+class OpenAddressingHashTable(MutableMapping):
+    """
+    A hash table using open addressing with linear probing for collision resolution.
+    The first slot comes from the top bits of the hash times a large odd constant
+    (Fibonacci hashing), so keys such as ids or timestamps that share their low bits
+    do not all start probing at the same slot.
+    Hashes, keys and values live in three parallel flat arrays (the hashes in a
+    compact array('q')), so an insert allocates no per-entry or per-bucket lists.
+    It has the same API as HashTable: set_item, get_item, delete_item and the
+    MutableMapping protocol with lazy keys/values/items views.
+    """
+    def __init__(self, size=8, max_load_factor=0.66, min_load_factor=None):
+        """
+        Args:
+            size: The initial number of slots, rounded up to a power of two.
+            max_load_factor: The fraction of used slots (entries and tombstones)
+                above which the table is rebuilt. Must be below 1.
+            min_load_factor: The load factor below which delete_item shrinks the table
+                (never below the initial size). None disables shrinking. Must be below
+                max_load_factor / 2, so a table that just shrank is not already due to grow.
+        """
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        if min_load_factor is not None and not 0 <= min_load_factor < max_load_factor / 2:
+            raise ValueError("min_load_factor must be between 0 and max_load_factor / 2")
+
+        capacity = 1
+        while capacity < size:
+            capacity *= 2
+        self.count = 0
+        self.tombstones = 0
+        self.initial_size = capacity
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.__allocate(capacity)
+
+    def __allocate(self, size):
+        self.size = size
+        self.shift = 65 - size.bit_length()
+        self.hashes = array("q", bytes(8 * size))
+        self.keys_array = [_EMPTY] * size
+        self.values_array = [None] * size
+
+    def load_factor(self):
+        """
+        Returns the current load factor (number of entries per slot).
+        """
+        return self.count / self.size
+
+    def resize(self, size):
+        """
+        Reinserts every entry into a table with the given number of slots,
+        dropping all tombstones.
+        Args:
+            size: The new number of slots, a power of two larger than the number of entries.
+        """
+        if size <= self.count:
+            raise ValueError("size must be larger than the number of entries")
+        hashes = self.hashes
+        keys = self.keys_array
+        values = self.values_array
+        self.__allocate(size)
+        self.tombstones = 0
+
+        new_hashes = self.hashes
+        new_keys = self.keys_array
+        new_values = self.values_array
+        mask = size - 1
+        shift = self.shift
+        for i, key in enumerate(keys):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            h = hashes[i]
+            j = ((h * _MULTIPLIER) & _MASK64) >> shift
+            while new_keys[j] is not _EMPTY:
+                j = (j + 1) & mask
+            new_hashes[j] = h
+            new_keys[j] = key
+            new_values[j] = values[i]
+
+    def __find(self, key, h):
+        """
+        Returns the slot holding key, or -1 if the key is not in the table.
+        """
+        keys = self.keys_array
+        hashes = self.hashes
+        mask = self.size - 1
+        i = ((h * _MULTIPLIER) & _MASK64) >> self.shift
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                return i
+            i = (i + 1) & mask
+
+    def set_item(self, key, value):
+        """
+        Inserts or updates a key-value pair in the hash table.
+        The first tombstone on the probe sequence is reused for new keys.
+        Args:
+            key: The key to insert or update.
+            value: The value associated with the key.
+        """
+        h = hash(key)
+        keys = self.keys_array
+        hashes = self.hashes
+        mask = self.size - 1
+        i = ((h * _MULTIPLIER) & _MASK64) >> self.shift
+        free = -1
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                break
+            if k is _DELETED:
+                if free < 0:
+                    free = i
+            elif hashes[i] == h and (k is key or k == key):
+                self.values_array[i] = value
+                return
+            i = (i + 1) & mask
+
+        if free >= 0:
+            i = free
+            self.tombstones -= 1
+        hashes[i] = h
+        keys[i] = key
+        self.values_array[i] = value
+        self.count += 1
+
+        if self.count + self.tombstones > self.size * self.max_load_factor:
+            if self.count > self.size * self.max_load_factor / 2:
+                self.resize(2 * self.size)
+            else:
+                self.resize(self.size)
+
+    def get_item(self, key):
+        """
+        Retrieves the value associated with a key in the hash table.
+        If the key does not exist, it returns None.
+        Args:
+            key: The key to retrieve.
+        Returns:
+            The value associated with the key, or None if the key does not exist.
+        """
+        i = self.__find(key, hash(key))
+        if i < 0:
+            return None
+        return self.values_array[i]
+
+    def delete_item(self, key):
+        """
+        Removes a key and its value, leaving a tombstone in its slot.
+        Shrinks the table when min_load_factor is set and the load factor falls below it.
+        Args:
+            key: The key to remove.
+        Returns:
+            bool: True if the key was removed, False if it does not exist.
+        """
+        i = self.__find(key, hash(key))
+        if i < 0:
+            return False
+
+        self.keys_array[i] = _DELETED
+        self.values_array[i] = None
+        self.count -= 1
+        self.tombstones += 1
+        # As in HashTable, the halved table must keep a quarter of max_load_factor as headroom.
+        if (self.min_load_factor is not None and self.size > self.initial_size
+                and self.count < self.size * self.min_load_factor
+                and self.count < self.size // 2 * self.max_load_factor * 0.75):
+            self.resize(self.size // 2)
+        return True
+
+    def reserve(self, count):
+        """
+        Grows the table once so that it can hold count entries (plus the current
+        tombstones) without exceeding max_load_factor.
+        Args:
+            count: The number of entries the table should hold.
+        """
+        size = self.size
+        while count + self.tombstones > size * self.max_load_factor:
+            size *= 2
+        if size != self.size:
+            self.resize(size)
+
+    def set_many(self, pairs):
+        """
+        Inserts or updates many key-value pairs at once.
+        The table is resized at most once up front, and the probing loop works on
+        local variables instead of calling set_item for every pair.
+        Args:
+            pairs: A mapping or an iterable of (key, value) pairs.
+        """
+        if isinstance(pairs, Mapping):
+            pairs = pairs.items()
+        elif not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+        self.reserve(self.count + len(pairs))
+
+        hashes = self.hashes
+        keys = self.keys_array
+        values = self.values_array
+        mask = self.size - 1
+        shift = self.shift
+        added = 0
+        reused = 0
+        for key, value in pairs:
+            h = hash(key)
+            i = ((h * _MULTIPLIER) & _MASK64) >> shift
+            free = -1
+            while True:
+                k = keys[i]
+                if k is _EMPTY:
+                    break
+                if k is _DELETED:
+                    if free < 0:
+                        free = i
+                elif hashes[i] == h and (k is key or k == key):
+                    break
+                i = (i + 1) & mask
+
+            if k is _EMPTY:
+                if free >= 0:
+                    i = free
+                    reused += 1
+                hashes[i] = h
+                keys[i] = key
+                added += 1
+            values[i] = value
+        self.count += added
+        self.tombstones -= reused
+
+    def get_many(self, keys, default=None):
+        """
+        Retrieves the values of many keys at once.
+        Args:
+            keys: An iterable of keys.
+            default: The value returned for keys that do not exist.
+        Returns:
+            list: The values, in the order of keys.
+        """
+        hashes = self.hashes
+        slots = self.keys_array
+        values_array = self.values_array
+        mask = self.size - 1
+        shift = self.shift
+        values = []
+        append = values.append
+        for key in keys:
+            h = hash(key)
+            i = ((h * _MULTIPLIER) & _MASK64) >> shift
+            while True:
+                k = slots[i]
+                if k is _EMPTY:
+                    append(default)
+                    break
+                if k is not _DELETED and hashes[i] == h and (k is key or k == key):
+                    append(values_array[i])
+                    break
+                i = (i + 1) & mask
+        return values
+
+    def __getitem__(self, key):
+        i = self.__find(key, hash(key))
+        if i < 0:
+            raise KeyError(key)
+        return self.values_array[i]
+
+    def __setitem__(self, key, value):
+        self.set_item(key, value)
+
+    def __delitem__(self, key):
+        if not self.delete_item(key):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return self.__find(key, hash(key)) >= 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for key in self.keys_array:
+            if key is not _EMPTY and key is not _DELETED:
+                yield key
+
+    def _iter_items(self):
+        values = self.values_array
+        for i, key in enumerate(self.keys_array):
+            if key is not _EMPTY and key is not _DELETED:
+                yield key, values[i]
+
+    def values(self):
+        """
+        Returns a lazy view of the values in the hash table.
+        """
+        return _ValuesView(self)
+
+    def items(self):
+        """
+        Returns a lazy view of the (key, value) pairs in the hash table.
+        """
+        return _ItemsView(self)
+
+    def clear(self):
+        """
+        Removes every entry and returns the table to its initial size.
+        """
+        self.__allocate(self.initial_size)
+        self.count = 0
+        self.tombstones = 0
+
+
+class ConcurrentHashTable(MutableMapping):
+    """
+    A thread-safe hash table using lock striping.
+    The keys are partitioned by hash into a fixed number of stripes; each stripe is
+    a HashTable guarded by its own lock, so threads touching different stripes
+    never wait for each other. Iteration is weakly consistent: each stripe is
+    snapshotted under its lock, one stripe at a time.
+    """
+    def __init__(self, stripes=16, size=7, max_load_factor=0.75):
+        """
+        Args:
+            stripes: The number of independently locked stripes.
+            size: The initial number of buckets of each stripe.
+            max_load_factor: The load factor above which a stripe grows.
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self.stripes = [HashTable(size, max_load_factor) for _ in range(stripes)]
+        self.locks = [threading.Lock() for _ in range(stripes)]
+
+    def __stripe(self, key):
+        """
+        Picks the stripe from the top bits of the scrambled hash (as OpenAddressingHashTable
+        picks its first slot), so the choice is independent of hash % size, which picks
+        the bucket inside the stripe, whatever the number of stripes.
+        """
+        return ((hash(key) * _MULTIPLIER) & _MASK64) * len(self.stripes) >> 64
+
+    def set_item(self, key, value):
+        """
+        Inserts or updates a key-value pair, locking only the key's stripe.
+        Args:
+            key: The key to insert or update.
+            value: The value associated with the key.
+        """
+        index = self.__stripe(key)
+        with self.locks[index]:
+            self.stripes[index].set_item(key, value)
+
+    def get_item(self, key):
+        """
+        Retrieves the value associated with a key, or None if the key does not exist.
+        Args:
+            key: The key to retrieve.
+        """
+        index = self.__stripe(key)
+        with self.locks[index]:
+            return self.stripes[index].get_item(key)
+
+    def delete_item(self, key):
+        """
+        Removes a key and its value.
+        Args:
+            key: The key to remove.
+        Returns:
+            bool: True if the key was removed, False if it does not exist.
+        """
+        index = self.__stripe(key)
+        with self.locks[index]:
+            return self.stripes[index].delete_item(key)
+
+    def setdefault(self, key, default=None):
+        """
+        Atomically returns the value of key, inserting default first if the key does not exist.
+        """
+        index = self.__stripe(key)
+        with self.locks[index]:
+            stripe = self.stripes[index]
+            if key in stripe:
+                return stripe[key]
+            stripe.set_item(key, default)
+            return default
+
+    __marker = object()
+
+    def pop(self, key, default=__marker):
+        """
+        Atomically removes key and returns its value. If the key does not exist, returns
+        default, or raises KeyError when no default is given.
+        """
+        index = self.__stripe(key)
+        with self.locks[index]:
+            stripe = self.stripes[index]
+            if key in stripe:
+                value = stripe[key]
+                stripe.delete_item(key)
+                return value
+        if default is self.__marker:
+            raise KeyError(key)
+        return default
+
+    def popitem(self):
+        """
+        Atomically removes and returns some (key, value) pair.
+        Raises KeyError if the table is empty.
+        """
+        for lock, stripe in zip(self.locks, self.stripes):
+            with lock:
+                if stripe.count:
+                    key = next(iter(stripe))
+                    value = stripe[key]
+                    stripe.delete_item(key)
+                    return key, value
+        raise KeyError("popitem(): table is empty")
+
+    def __getitem__(self, key):
+        index = self.__stripe(key)
+        with self.locks[index]:
+            return self.stripes[index][key]
+
+    def __setitem__(self, key, value):
+        self.set_item(key, value)
+
+    def __delitem__(self, key):
+        if not self.delete_item(key):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        index = self.__stripe(key)
+        with self.locks[index]:
+            return key in self.stripes[index]
+
+    def __len__(self):
+        return sum(stripe.count for stripe in self.stripes)
+
+    def __iter__(self):
+        for lock, stripe in zip(self.locks, self.stripes):
+            with lock:
+                keys = list(stripe)
+            yield from keys
+
+    def _iter_items(self):
+        for lock, stripe in zip(self.locks, self.stripes):
+            with lock:
+                items = list(stripe._iter_items())
+            yield from items
+
+    def values(self):
+        """
+        Returns a lazy, weakly consistent view of the values in the table.
+        """
+        return _ValuesView(self)
+
+    def items(self):
+        """
+        Returns a lazy, weakly consistent view of the (key, value) pairs in the table.
+        """
+        return _ItemsView(self)
+
+    def clear(self):
+        """
+        Removes every entry, one stripe at a time.
+        """
+        for lock, stripe in zip(self.locks, self.stripes):
+            with lock:
+                stripe.clear()
+
+
+class DiskHashTable(Mapping):
+    """
+    A read-only hash table stored in a file and accessed through a memory map.
+    The file has a fixed-width slot layout (open addressing with linear probing),
+    so opening a table only maps the file: pages are read lazily on lookup and
+    shared by every process that opens the same file.
+    Keys must be str, bytes or int; values can be anything picklable.
+    File layout:
+    - header: magic, number of slots, number of entries, key width, value width
+    - slots: key hash (8 bytes), key length (2), value length (4), key bytes, value bytes
+      A slot with key length 0 is empty.
+    """
+    MAGIC = b"DSAHASH1"
+    _HEADER = struct.Struct("<8sQQII")
+    _SLOT = struct.Struct("<QHI")
+    _PICKLE_PROTOCOL = 4
+
+    def __init__(self, path):
+        """
+        Opens a table written by save, read-only.
+        Args:
+            path: The path of the table file.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size, self.count, self.key_width, self.value_width = self._HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC:
+            self.map.close()
+            raise ValueError(f"{path} is not a DiskHashTable file")
+        self.slot_size = self._SLOT.size + self.key_width + self.value_width
+
+    @classmethod
+    def open(cls, path):
+        """
+        Opens a table written by save, read-only.
+        Args:
+            path: The path of the table file.
+        Returns:
+            DiskHashTable: The opened table.
+        """
+        return cls(path)
+
+    @classmethod
+    def save(cls, mapping, path, key_width=64, value_width=256, max_load_factor=0.5):
+        """
+        Writes the entries of a mapping (e.g. a HashTable) to a table file and opens it.
+        Args:
+            mapping: A mapping or an iterable of (key, value) pairs.
+            path: The path of the file to write.
+            key_width: The number of bytes reserved for each encoded key, at most 65535
+                (key lengths are stored in 2 bytes).
+            value_width: The number of bytes reserved for each pickled value.
+            max_load_factor: The maximum fraction of slots in use. Must be below 1,
+                so that every probe sequence ends at an empty slot.
+        Returns:
+            DiskHashTable: The written table, opened read-only.
+        Raises:
+            ValueError: If an argument is out of range, or a key or value does not fit in its slot width.
+        """
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        if not 0 < key_width <= 0xFFFF:
+            raise ValueError("key_width must be between 1 and 65535")
+
+        pairs = mapping.items() if isinstance(mapping, Mapping) else list(mapping)
+        size = 1
+        while len(pairs) > size * max_load_factor:
+            size *= 2
+
+        slot_size = cls._SLOT.size + key_width + value_width
+        data = bytearray(cls._HEADER.size + size * slot_size)
+        key_offset = cls._SLOT.size
+        value_offset = key_offset + key_width
+        mask = size - 1
+        count = 0
+        for key, value in pairs:
+            encoded_key = cls.__encode_key(key)
+            encoded_value = pickle.dumps(value, protocol=cls._PICKLE_PROTOCOL)
+            if len(encoded_key) > key_width:
+                raise ValueError(f"key {key!r} does not fit in {key_width} bytes")
+            if len(encoded_value) > value_width:
+                raise ValueError(f"value for key {key!r} does not fit in {value_width} bytes")
+
+            h = cls.__hash(encoded_key)
+            i = h & mask
+            while True:
+                offset = cls._HEADER.size + i * slot_size
+                _, key_length, _ = cls._SLOT.unpack_from(data, offset)
+                if key_length == 0:
+                    count += 1
+                    break
+                if data[offset + key_offset:offset + key_offset + key_length] == encoded_key:
+                    break
+                i = (i + 1) & mask
+            cls._SLOT.pack_into(data, offset, h, len(encoded_key), len(encoded_value))
+            data[offset + key_offset:offset + key_offset + len(encoded_key)] = encoded_key
+            data[offset + value_offset:offset + value_offset + len(encoded_value)] = encoded_value
+
+        cls._HEADER.pack_into(data, 0, cls.MAGIC, size, count, key_width, value_width)
+        with open(path, "wb") as file:
+            file.write(data)
+        return cls(path)
+
+    @staticmethod
+    def __encode_key(key):
+        """
+        Encodes a key to bytes deterministically (the same key gives the same bytes in every process).
+        """
+        if isinstance(key, str):
+            return b"s" + key.encode("utf-8")
+        if isinstance(key, bytes):
+            return b"b" + key
+        if isinstance(key, int) and not isinstance(key, bool):
+            return b"i" + str(key).encode("ascii")
+        raise TypeError(f"DiskHashTable keys must be str, bytes or int, not {type(key).__name__}")
+
+    @staticmethod
+    def __decode_key(data):
+        tag, body = data[:1], data[1:]
+        if tag == b"s":
+            return body.decode("utf-8")
+        if tag == b"b":
+            return body
+        return int(body)
+
+    @staticmethod
+    def __hash(encoded_key):
+        """
+        A hash that is stable across processes, unlike the salted built-in hash of str and bytes.
+        """
+        return int.from_bytes(hashlib.blake2b(encoded_key, digest_size=8).digest(), "little")
+
+    def __find(self, key):
+        """
+        Returns the offset of the slot holding key, or -1 if the key is not in the table.
+        """
+        try:
+            encoded_key = self.__encode_key(key)
+        except TypeError:
+            return -1
+
+        data = self.map
+        h = self.__hash(encoded_key)
+        mask = self.size - 1
+        key_offset = self._SLOT.size
+        i = h & mask
+        while True:
+            offset = self._HEADER.size + i * self.slot_size
+            slot_hash, key_length, _ = self._SLOT.unpack_from(data, offset)
+            if key_length == 0:
+                return -1
+            if slot_hash == h and data[offset + key_offset:offset + key_offset + key_length] == encoded_key:
+                return offset
+            i = (i + 1) & mask
+
+    def __value(self, offset):
+        _, _, value_length = self._SLOT.unpack_from(self.map, offset)
+        start = offset + self._SLOT.size + self.key_width
+        return pickle.loads(self.map[start:start + value_length])
+
+    def get_item(self, key):
+        """
+        Retrieves the value associated with a key in the table.
+        If the key does not exist, it returns None.
+        Args:
+            key: The key to retrieve.
+        Returns:
+            The value associated with the key, or None if the key does not exist.
+        """
+        offset = self.__find(key)
+        if offset < 0:
+            return None
+        return self.__value(offset)
+
+    def __getitem__(self, key):
+        offset = self.__find(key)
+        if offset < 0:
+            raise KeyError(key)
+        return self.__value(offset)
+
+    def __contains__(self, key):
+        return self.__find(key) >= 0
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for _, key, _ in self.__slots():
+            yield key
+
+    def _iter_items(self):
+        for offset, key, _ in self.__slots():
+            yield key, self.__value(offset)
+
+    def __slots(self):
+        """
+        Yields (offset, key, value length) for every used slot in file order.
+        """
+        data = self.map
+        key_offset = self._SLOT.size
+        for i in range(self.size):
+            offset = self._HEADER.size + i * self.slot_size
+            _, key_length, value_length = self._SLOT.unpack_from(data, offset)
+            if key_length:
+                yield offset, self.__decode_key(data[offset + key_offset:offset + key_offset + key_length]), value_length
+
+    def values(self):
+        """
+        Returns a lazy view of the values in the table.
+        """
+        return _ValuesView(self)
+
+    def items(self):
+        """
+        Returns a lazy view of the (key, value) pairs in the table.
+        """
+        return _ItemsView(self)
+
+    def close(self):
+        """
+        Unmaps the file.
+        """
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -9,14 +9,84 @@ What is a Heap?
     - Left Child: 2 * parent Index
     - Right Child: 2 * parent Index + 1
     - Parent: floor(child Index / 2)
+- Top-K: Keeping the k largest values of a stream in a min-heap of size k; the root is the one to beat.
+- K-way merge: Merging k sorted inputs by repeatedly taking the smallest of their k heads from a min-heap.
+- Indexed heap: A heap that also maps each item to its position in the heap list, so an item's
+  priority can be changed (decrease-key) or the item removed in O(log n) without searching for it.
 """
 
 import heapq
 
 
 class MaxHeap:
-    def __init__(self):
+    def __init__(self, key=None, stable=False):
+        """
+        Args:
+            key: A function computing the value each item is ordered by, or None to compare items.
+            stable: If True, equal keys come out in insertion order (first in, first out).
+        With a key or stable=True, the keys are kept in the parallel list _keys (and, when stable,
+        the insertion numbers in _seq), so callers need no (priority, counter, item) tuples.
+        """
         self.heap = []
+        self.key = key
+        self.stable = stable
+        self._keyed = key is not None or stable
+        self._keys = []
+        self._seq = [] if stable else None
+        self._counter = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, key=None, stable=False):
+        """
+        Builds a heap from the values of an iterable in O(n).
+        Args:
+            iterable: The values to put in the heap, in any order.
+            key: See __init__.
+            stable: See __init__; ties come out in the iterable's order.
+        Returns:
+            The new heap.
+        """
+        max_heap = cls(key, stable)
+        max_heap._extend(iterable)
+        max_heap.heapify()
+        return max_heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _extend(self, values):
+        """
+        Appends values to the heap list (and the key lists) without restoring the heap property.
+        Like _entry, numbers the values from _counter + 1, leaving _counter at the last number used.
+        """
+        if not self._keyed:
+            self.heap.extend(values)
+            return
+        values = list(values)
+        self.heap.extend(values)
+        self._keys.extend(values if self.key is None else map(self.key, values))
+        if self.stable:
+            self._seq.extend(range(self._counter + 1, self._counter + 1 + len(values)))
+            self._counter += len(values)
+
+    def _entry(self, value):
+        """
+        Returns the key and insertion number of a new value in keyed mode.
+        Without stable there are no insertion numbers and the number is None.
+        """
+        key = value if self.key is None else self.key(value)
+        if not self.stable:
+            return key, None
+        self._counter += 1
+        return key, self._counter
+
+    def heapify(self):
+        """
+        Restores the heap property over the whole heap list in O(n) (Floyd's method):
+        sinks down every parent, from the last one back to the root. Leaves are already heaps.
+        """
+        for index in range(len(self.heap) // 2 - 1, -1, -1):
+            self._sink_down(index)
 
     def _left_child(self, index):
         return 2 * index + 1
@@ -33,32 +103,157 @@ class MaxHeap:
     def _sink_down(self, index):
         """
         Sinks down the value at the given index to its proper position in the heap.
+        The value is lifted out, leaving a hole that moves down as larger children are
+        copied up into it, and is written once into the final hole: one store per level
+        instead of a swap, with the child index math inlined.
         """
-        while True:
-            left = self._left_child(index)
-            right = self._right_child(index)
-            largest = index
-
-            if left < len(self.heap) and self.heap[left] > self.heap[largest]:
-                largest = left
-            if right < len(self.heap) and self.heap[right] > self.heap[largest]:
-                largest = right
-            if largest == index:
+        if self._keyed:
+            if self.stable:
+                self._stable_sink_down(index)
+            else:
+                self._keyed_sink_down(index)
+            return
+        heap = self.heap
+        size = len(heap)
+        value = heap[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and heap[right] > heap[child]:
+                child = right
+            if not heap[child] > value:
+                break
+            heap[index] = heap[child]
+            index = child
+            child = 2 * index + 1
+        heap[index] = value
+
+    def _keyed_sink_down(self, index):
+        """
+        _sink_down for keyed mode: compares _keys and moves the value and key together.
+        """
+        heap = self.heap
+        keys = self._keys
+        size = len(heap)
+        value = heap[index]
+        key = keys[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and keys[right] > keys[child]:
+                child = right
+            child_key = keys[child]
+            if not child_key > key:
+                break
+            heap[index] = heap[child]
+            keys[index] = child_key
+            index = child
+            child = 2 * index + 1
+        heap[index] = value
+        keys[index] = key
+
+    def _keyed_sift_up(self, index):
+        """
+        Moves the entry at index up in keyed mode.
+        """
+        heap = self.heap
+        keys = self._keys
+        value = heap[index]
+        key = keys[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            parent_key = keys[parent]
+            if not key > parent_key:
+                break
+            heap[index] = heap[parent]
+            keys[index] = parent_key
+            index = parent
+        heap[index] = value
+        keys[index] = key
+
+    def _stable_sink_down(self, index):
+        """
+        _sink_down for stable mode: compares _keys, then (on equal keys) the smaller _seq wins,
+        and moves the value, key and insertion number together.
+        """
+        heap = self.heap
+        keys = self._keys
+        seq = self._seq
+        size = len(heap)
+        value = heap[index]
+        key = keys[index]
+        order = seq[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size:
+                right_key = keys[right]
+                child_key = keys[child]
+                if right_key > child_key or (not child_key > right_key and seq[right] < seq[child]):
+                    child = right
+            child_key = keys[child]
+            if not (child_key > key or (not key > child_key and seq[child] < order)):
                 break
-            self._swap(index, largest)
-            index = largest
+            heap[index] = heap[child]
+            keys[index] = child_key
+            seq[index] = seq[child]
+            index = child
+            child = 2 * index + 1
+        heap[index] = value
+        keys[index] = key
+        seq[index] = order
+
+    def _stable_sift_up(self, index):
+        """
+        Moves the entry at index up in stable mode; a new entry never passes an equal key.
+        """
+        heap = self.heap
+        keys = self._keys
+        seq = self._seq
+        value = heap[index]
+        key = keys[index]
+        order = seq[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            parent_key = keys[parent]
+            if not (key > parent_key or (not parent_key > key and order < seq[parent])):
+                break
+            heap[index] = heap[parent]
+            keys[index] = parent_key
+            seq[index] = seq[parent]
+            index = parent
+        heap[index] = value
+        keys[index] = key
+        seq[index] = order
 
     def insert(self, value):
         """
         Inserts a new value into the heap.
+        Smaller parents are moved down into the hole left at the end of the list,
+        and the value is written once into the final hole.
         Args:
             value: The value to insert.
         """
-        self.heap.append(value)
-        current = len(self.heap) - 1
-        while current > 0 and self.heap[current] > self.heap[self._parent(current)]:
-            self._swap(current, self._parent(current))
-            current = self._parent(current)
+        if self._keyed:
+            key, order = self._entry(value)
+            self.heap.append(value)
+            self._keys.append(key)
+            if self.stable:
+                self._seq.append(order)
+                self._stable_sift_up(len(self.heap) - 1)
+            else:
+                self._keyed_sift_up(len(self.heap) - 1)
+            return
+        heap = self.heap
+        heap.append(value)
+        current = len(heap) - 1
+        while current > 0:
+            parent = (current - 1) // 2
+            if not value > heap[parent]:
+                break
+            heap[current] = heap[parent]
+            current = parent
+        heap[current] = value
 
     def remove(self):
         """
@@ -68,6 +263,12 @@ class MaxHeap:
         """
         if len(self.heap) == 0:
             raise IndexError("remove from empty heap")
+        if self._keyed:
+            self._keys[0] = self._keys[-1]
+            self._keys.pop()
+            if self.stable:
+                self._seq[0] = self._seq[-1]
+                self._seq.pop()
         if len(self.heap) == 1:
             return self.heap.pop()
 
@@ -76,11 +277,210 @@ class MaxHeap:
         self._sink_down(0)
         return root
 
+    def push_many(self, values):
+        """
+        Inserts several values. When the batch is large compared to the heap, the values
+        are appended and the whole heap is rebuilt in O(n + k) instead of k sift-ups.
+        Args:
+            values: An iterable of values to insert.
+        """
+        values = list(values)
+        total = len(self.heap) + len(values)
+        if len(values) * total.bit_length() > 2 * total:
+            self._extend(values)
+            self.heapify()
+        else:
+            for value in values:
+                self.insert(value)
+
+    def pushpop(self, value):
+        """
+        Inserts a value, then removes and returns the maximum value, with at most one sift.
+        Faster than insert followed by remove.
+        Args:
+            value: The value to insert.
+        Returns:
+            The maximum of value and the values in the heap.
+        """
+        if len(self.heap) == 0:
+            return value
+        if self._keyed:
+            key, order = self._entry(value)
+            root_key = self._keys[0]
+            if self.stable:
+                if not (root_key > key or (not key > root_key and self._seq[0] < order)):
+                    return value
+                self._seq[0] = order
+            elif not root_key > key:
+                return value
+            self._keys[0] = key
+        elif not self.heap[0] > value:
+            return value
+        root = self.heap[0]
+        self.heap[0] = value
+        self._sink_down(0)
+        return root
+
+    def replace(self, value):
+        """
+        Removes and returns the maximum value, then inserts a new value, with one sift.
+        Unlike pushpop, the returned value is always the old maximum, even if value is larger.
+        Args:
+            value: The value to insert.
+        Returns:
+            The maximum value that was in the heap.
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if len(self.heap) == 0:
+            raise IndexError("replace on empty heap")
+        if self._keyed:
+            key, order = self._entry(value)
+            self._keys[0] = key
+            if self.stable:
+                self._seq[0] = order
+        root = self.heap[0]
+        self.heap[0] = value
+        self._sink_down(0)
+        return root
+
 
 # Heap using in built library
 class MinHeap:
-    def __init__(self):
+    def __init__(self, key=None, stable=False):
+        """
+        Args:
+            key: A function computing the value each item is ordered by, or None to compare items.
+            stable: If True, equal keys come out in insertion order (first in, first out).
+        Without key and stable the heap is a plain heapq list. Otherwise the keys are kept in
+        the parallel list _keys (and, when stable, the insertion numbers in _seq) and the heap
+        sifts itself, since heapq can only compare the stored items.
+        """
         self.heap = []
+        self.key = key
+        self.stable = stable
+        self._keyed = key is not None or stable
+        self._keys = []
+        self._seq = [] if stable else None
+        self._counter = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _entry(self, value):
+        """
+        Returns the key and insertion number of a new value in keyed mode.
+        Without stable there are no insertion numbers and the number is None.
+        """
+        key = value if self.key is None else self.key(value)
+        if not self.stable:
+            return key, None
+        self._counter += 1
+        return key, self._counter
+
+    def _sink_down(self, index):
+        """
+        Moves the entry at index down in keyed mode.
+        """
+        if self.stable:
+            self._stable_sink_down(index)
+            return
+        heap = self.heap
+        keys = self._keys
+        size = len(heap)
+        value = heap[index]
+        key = keys[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and keys[right] < keys[child]:
+                child = right
+            child_key = keys[child]
+            if not child_key < key:
+                break
+            heap[index] = heap[child]
+            keys[index] = child_key
+            index = child
+            child = 2 * index + 1
+        heap[index] = value
+        keys[index] = key
+
+    def _sift_up(self, index):
+        """
+        Moves the entry at index up in keyed mode.
+        """
+        if self.stable:
+            self._stable_sift_up(index)
+            return
+        heap = self.heap
+        keys = self._keys
+        value = heap[index]
+        key = keys[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            parent_key = keys[parent]
+            if not key < parent_key:
+                break
+            heap[index] = heap[parent]
+            keys[index] = parent_key
+            index = parent
+        heap[index] = value
+        keys[index] = key
+
+    def _stable_sink_down(self, index):
+        """
+        Moves the entry at index down in stable mode: a smaller key wins,
+        and on equal keys the smaller _seq wins.
+        """
+        heap = self.heap
+        keys = self._keys
+        seq = self._seq
+        size = len(heap)
+        value = heap[index]
+        key = keys[index]
+        order = seq[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size:
+                right_key = keys[right]
+                child_key = keys[child]
+                if right_key < child_key or (not child_key < right_key and seq[right] < seq[child]):
+                    child = right
+            child_key = keys[child]
+            if not (child_key < key or (not key < child_key and seq[child] < order)):
+                break
+            heap[index] = heap[child]
+            keys[index] = child_key
+            seq[index] = seq[child]
+            index = child
+            child = 2 * index + 1
+        heap[index] = value
+        keys[index] = key
+        seq[index] = order
+
+    def _stable_sift_up(self, index):
+        """
+        Moves the entry at index up in stable mode; a new entry never passes an equal key.
+        """
+        heap = self.heap
+        keys = self._keys
+        seq = self._seq
+        value = heap[index]
+        key = keys[index]
+        order = seq[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            parent_key = keys[parent]
+            if not (key < parent_key or (not parent_key < key and order < seq[parent])):
+                break
+            heap[index] = heap[parent]
+            keys[index] = parent_key
+            seq[index] = seq[parent]
+            index = parent
+        heap[index] = value
+        keys[index] = key
+        seq[index] = order
 
     def insert(self, value):
         """
@@ -88,7 +488,15 @@ class MinHeap:
         Args:
             value: The value to insert.
         """
-        heapq.heappush(self.heap, value)
+        if not self._keyed:
+            heapq.heappush(self.heap, value)
+            return
+        key, order = self._entry(value)
+        self.heap.append(value)
+        self._keys.append(key)
+        if self.stable:
+            self._seq.append(order)
+        self._sift_up(len(self.heap) - 1)
 
     def remove(self):
         """
@@ -98,7 +506,385 @@ class MinHeap:
         """
         if len(self.heap) == 0:
             raise IndexError("remove from empty heap")
-        return heapq.heappop(self.heap)
+        if not self._keyed:
+            return heapq.heappop(self.heap)
+
+        root = self.heap[0]
+        value = self.heap.pop()
+        key = self._keys.pop()
+        order = self._seq.pop() if self.stable else None
+        if self.heap:
+            self.heap[0] = value
+            self._keys[0] = key
+            if self.stable:
+                self._seq[0] = order
+            self._sink_down(0)
+        return root
+
+    def pushpop(self, value):
+        """
+        Inserts a value, then removes and returns the minimum value, with at most one sift.
+        Args:
+            value: The value to insert.
+        Returns:
+            The minimum of value and the values in the heap.
+        """
+        if not self._keyed:
+            return heapq.heappushpop(self.heap, value)
+        if len(self.heap) == 0:
+            return value
+        key, order = self._entry(value)
+        root_key = self._keys[0]
+        if self.stable:
+            if not (root_key < key or (not key < root_key and self._seq[0] < order)):
+                return value
+            self._seq[0] = order
+        elif not root_key < key:
+            return value
+        root = self.heap[0]
+        self.heap[0] = value
+        self._keys[0] = key
+        self._sink_down(0)
+        return root
+
+    def replace(self, value):
+        """
+        Removes and returns the minimum value, then inserts a new value, with one sift.
+        Args:
+            value: The value to insert.
+        Returns:
+            The minimum value that was in the heap.
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if len(self.heap) == 0:
+            raise IndexError("replace on empty heap")
+        if not self._keyed:
+            return heapq.heapreplace(self.heap, value)
+        root = self.heap[0]
+        self.heap[0] = value
+        key, order = self._entry(value)
+        self._keys[0] = key
+        if self.stable:
+            self._seq[0] = order
+        self._sink_down(0)
+        return root
+
+
+class _TopKHeap(MinHeap):
+    """
+    The stable min-heap behind TopK. Insertion numbers count down instead of up,
+    so the latest of several equal keys sits nearest the root and is evicted first.
+    """
+    def _entry(self, value):
+        key = value if self.key is None else self.key(value)
+        self._counter -= 1
+        return key, self._counter
+
+
+class TopK:
+    """
+    Keeps the k largest values seen in a stream, holding at most k values in memory.
+    A min-heap of the values kept so far: a new value only has to beat the smallest
+    of them (the root), so each push is O(1) for a value that is not kept and O(log k) otherwise.
+    Ties go to the earlier value, like sorted(..., reverse=True)[:k]: a new value must have a
+    strictly greater key to get in, and among kept values with equal keys the latest is evicted first.
+    The heap is wrapped rather than inherited, so push is the only way in and the k limit always holds.
+    """
+    def __init__(self, k, key=None):
+        """
+        Args:
+            k: The number of values to keep.
+            key: A function computing the value each item is ranked by, or None to compare items.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        self.k = k
+        self.key = key
+        self._heap = _TopKHeap(key=key, stable=True)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, value):
+        """
+        Offers a value to the accumulator.
+        Args:
+            value: The value to offer.
+        Returns:
+            True if the value is now among the k largest, False if it was discarded.
+        """
+        heap = self._heap
+        if len(heap.heap) < self.k:
+            heap.insert(value)
+            return True
+        if self.k == 0:
+            return False
+        key = value if self.key is None else self.key(value)
+        if not key > heap._keys[0]:
+            return False
+        heap._counter -= 1
+        heap.heap[0] = value
+        heap._keys[0] = key
+        heap._seq[0] = heap._counter
+        heap._sink_down(0)
+        return True
+
+    def extend(self, iterable):
+        """
+        Offers every value of an iterable, consuming it lazily.
+        """
+        push = self.push
+        for value in iterable:
+            push(value)
+
+    def result(self):
+        """
+        Returns the values kept, largest first; equal keys are in the order they were pushed.
+        """
+        heap = self._heap
+        keys = heap._keys
+        seq = heap._seq
+        order = sorted(range(len(heap.heap)), key=lambda index: (keys[index], seq[index]), reverse=True)
+        return [heap.heap[index] for index in order]
+
+
+def top_k(iterable, k, key=None):
+    """
+    Returns the k largest values of an iterable, largest first, holding only k of them in memory.
+    Same result as sorted(iterable, key=key, reverse=True)[:k].
+    Args:
+        iterable: The values, consumed lazily (any length, including unbounded streams cut off by the caller).
+        k: The number of values to return.
+        key: A function computing the value each item is ranked by, or None to compare items.
+    Returns:
+        A list of at most k values.
+    """
+    accumulator = TopK(k, key)
+    accumulator.extend(iterable)
+    return accumulator.result()
+
+
+def k_way_merge(*iterables, key=None):
+    """
+    Lazily merges sorted iterables into one sorted stream, like heapq.merge.
+    Holds one value per input at a time. Equal values come out in the order of the
+    inputs they came from (the heap key is (key(head), input index)).
+    Args:
+        *iterables: Iterables, each sorted in ascending order of key.
+        key: A function computing the value each item is ordered by, or None to compare items.
+    Yields:
+        The values of all the iterables, in ascending order.
+    """
+    iterators = [iter(iterable) for iterable in iterables]
+    heads = [None] * len(iterators)
+    if key is None:
+        order = lambda index: (heads[index], index)
+    else:
+        order = lambda index: (key(heads[index]), index)
+
+    exhausted = object()
+    sources = MinHeap(key=order)
+    for index, iterator in enumerate(iterators):
+        value = next(iterator, exhausted)
+        if value is not exhausted:
+            heads[index] = value
+            sources.insert(index)
+
+    top = sources.heap
+    replace = sources.replace
+    while len(top) > 1:
+        index = top[0]
+        yield heads[index]
+        value = next(iterators[index], exhausted)
+        if value is exhausted:
+            sources.remove()
+        else:
+            heads[index] = value
+            replace(index)
+
+    if top:
+        index = top[0]
+        yield heads[index]
+        yield from iterators[index]
+
+
+class IndexedMinHeap:
+    """
+    A min-heap of distinct, hashable items, each with a priority.
+    Keeps a dict from item to its index in the heap list, so contains is O(1) and
+    update_priority and remove(item) are O(log n). Used instead of pushing duplicate
+    entries and lazily skipping the stale ones, the heap never holds more than one
+    entry per item.
+    """
+    def __init__(self):
+        self.items = []
+        self.priorities = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.positions
+
+    def _before(self, a, b):
+        """
+        Returns True if priority a belongs closer to the root than priority b.
+        """
+        return a < b
+
+    def _sift_up(self, index):
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        item = items[index]
+        priority = priorities[index]
+        before = self._before
+        while index > 0:
+            parent = (index - 1) // 2
+            parent_priority = priorities[parent]
+            if not before(priority, parent_priority):
+                break
+            parent_item = items[parent]
+            items[index] = parent_item
+            priorities[index] = parent_priority
+            positions[parent_item] = index
+            index = parent
+        items[index] = item
+        priorities[index] = priority
+        positions[item] = index
+
+    def _sift_down(self, index):
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        size = len(items)
+        item = items[index]
+        priority = priorities[index]
+        before = self._before
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and before(priorities[right], priorities[child]):
+                child = right
+            child_priority = priorities[child]
+            if not before(child_priority, priority):
+                break
+            child_item = items[child]
+            items[index] = child_item
+            priorities[index] = child_priority
+            positions[child_item] = index
+            index = child
+        items[index] = item
+        priorities[index] = priority
+        positions[item] = index
+
+    def contains(self, item):
+        """
+        Checks if an item is in the heap.
+        Args:
+            item: The item to look for.
+        Returns:
+            True if the item is in the heap, False otherwise.
+        """
+        return item in self.positions
+
+    def priority(self, item):
+        """
+        Returns the current priority of an item.
+        Raises:
+            KeyError: If the item is not in the heap.
+        """
+        return self.priorities[self.positions[item]]
+
+    def insert(self, item, priority):
+        """
+        Inserts a new item with the given priority.
+        Args:
+            item: The item to insert; it must be hashable and not already in the heap.
+            priority: The item's priority.
+        Raises:
+            ValueError: If the item is already in the heap (use update_priority instead).
+        """
+        if item in self.positions:
+            raise ValueError("item already in heap")
+        self.items.append(item)
+        self.priorities.append(priority)
+        self.positions[item] = len(self.items) - 1
+        self._sift_up(len(self.items) - 1)
+
+    def update_priority(self, item, priority):
+        """
+        Changes the priority of an item already in the heap, in either direction.
+        Args:
+            item: The item to update.
+            priority: The item's new priority.
+        Raises:
+            KeyError: If the item is not in the heap.
+        """
+        index = self.positions[item]
+        old_priority = self.priorities[index]
+        self.priorities[index] = priority
+        if self._before(priority, old_priority):
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def peek(self):
+        """
+        Returns the (item, priority) pair at the top of the heap without removing it.
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if len(self.items) == 0:
+            raise IndexError("peek from empty heap")
+        return self.items[0], self.priorities[0]
+
+    def pop(self):
+        """
+        Removes and returns the (item, priority) pair at the top of the heap.
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if len(self.items) == 0:
+            raise IndexError("pop from empty heap")
+        item = self.items[0]
+        return item, self.remove(item)
+
+    def remove(self, item):
+        """
+        Removes an item from the heap.
+        Args:
+            item: The item to remove.
+        Returns:
+            The removed item's priority.
+        Raises:
+            KeyError: If the item is not in the heap.
+        """
+        index = self.positions.pop(item)
+        priority = self.priorities[index]
+        last_item = self.items.pop()
+        last_priority = self.priorities.pop()
+        if index < len(self.items):
+            self.items[index] = last_item
+            self.priorities[index] = last_priority
+            self.positions[last_item] = index
+            if self._before(last_priority, priority):
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        return priority
+
+
+class IndexedMaxHeap(IndexedMinHeap):
+    """
+    An indexed heap where the item with the largest priority is at the top.
+    """
+    def _before(self, a, b):
+        return a > b
 
 
 if __name__ == "__main__":
@@ -110,3 +896,19 @@ if __name__ == "__main__":
     print(max_heap.heap)  # Output: [30, 20, 5, 10]
     print(max_heap.remove())  # Output: 30
     print(max_heap.heap)  # Output: [20, 10, 5]
+
+    jobs = MaxHeap(key=lambda job: job[0], stable=True)
+    jobs.insert((0, "a"))
+    jobs.push_many([(0, "b"), (0, "c"), (1, "d")])
+    print(jobs.remove(), jobs.remove(), jobs.remove())  # Output: (1, 'd') (0, 'a') (0, 'b')
+
+    tasks = IndexedMinHeap()
+    tasks.insert("build", 3)
+    tasks.insert("test", 5)
+    tasks.insert("deploy", 9)
+    tasks.update_priority("deploy", 1)
+    tasks.remove("test")
+    print(tasks.pop(), "build" in tasks)  # Output: ('deploy', 1) True
+
+    print(top_k([5, 1, 9, 3, 7], 3))  # Output: [9, 7, 5]
+    print(list(k_way_merge([1, 4, 7], [2, 5], [3, 6])))  # Output: [1, 2, 3, 4, 5, 6, 7]
@@ -1,3 +1,5 @@
+from collections import deque
+
 from NodeConstructor import Node
 
 
@@ -187,3 +189,104 @@ class LinkedList:
             temp = after
 
         return True
+
+
+class TrackedLinkedList(LinkedList):
+    """
+    LinkedList that keeps a deque of its nodes in order (the "spine"),
+    so pop (remove from the end) is O(1) instead of a walk to the node before the tail
+    """
+    def __init__(self, value):
+        """
+        Initialise TrackedLinkedList
+        param value: Initial node value
+        """
+        super().__init__(value)
+        self._spine = deque([self.head])
+
+    def append(self, value):
+        """
+        Method to append (add to the end) an element to LinkedList
+        param value: Node value
+        """
+        super().append(value)
+        self._spine.append(self.tail)
+        return True
+
+    def pop(self):
+        """
+        Method to pop (remove from the end) an element from LinkedList in O(1)
+        """
+        if self.length == 0:
+            return None
+
+        temp = self._spine.pop()
+        self.length -= 1
+        if self.length == 0:
+            self.head = None
+            self.tail = None
+        else:
+            self.tail = self._spine[-1]
+            self.tail.next = None
+        return temp
+
+    def prepend(self, value):
+        """
+        Method to prepend (add to the begining) an element to LinkedList
+        param value: Node value
+        """
+        super().prepend(value)
+        self._spine.appendleft(self.head)
+        return True
+
+    def pop_first(self):
+        """
+        Method to pop first element from LinkedList
+        """
+        temp = super().pop_first()
+        if temp is not None:
+            self._spine.popleft()
+        return temp
+
+    def get(self, index):
+        """
+        Method to get LL node at the specified index
+        param index: LinkedList Index
+        """
+        if index < 0 or index >= self.length:
+            return None
+
+        return self._spine[index]
+
+    def insert(self, index, value):
+        """
+        Method to insert a new LL node at the specified index
+        param index: LinkedList Index
+        param value: node value to insert
+        """
+        if index <= 0 or index >= self.length:
+            return super().insert(index, value)
+
+        super().insert(index, value)
+        self._spine.insert(index, self._spine[index - 1].next)
+        return True
+
+    def remove(self, index):
+        """
+        Method to remove a LL node at the specified index
+        param index: LinkedList Index
+        """
+        if index <= 0 or index >= self.length - 1:
+            return super().remove(index)
+
+        temp = super().remove(index)
+        del self._spine[index]
+        return temp
+
+    def reverse(self):
+        """
+        Method to reverse LinkedList
+        """
+        super().reverse()
+        self._spine.reverse()
+        return True
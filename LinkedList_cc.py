@@ -1,7 +1,49 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
+from collections import deque
+from itertools import islice
+
+from NodeConstructor import Node
+
+
+def _merge_runs(left, left_tail, right, right_tail, key, reverse):
+    """
+    Merge two sorted, None-terminated runs of nodes by relinking them (stable:
+    on ties nodes from left come first). Each node's key is computed once.
+    :return: (head, tail) of the merged run.
+    """
+    left_key = left.value if key is None else key(left.value)
+    right_key = right.value if key is None else key(right.value)
+    head = tail = None
+    while True:
+        if reverse:
+            take_left = not left_key < right_key
+        else:
+            take_left = not right_key < left_key
+
+        if take_left:
+            node = left
+            left = left.next
+        else:
+            node = right
+            right = right.next
+
+        if tail is None:
+            head = node
+        else:
+            tail.next = node
+        tail = node
+
+        if left is None:
+            tail.next = right
+            return head, right_tail
+        if right is None:
+            tail.next = left
+            return head, left_tail
+
+        if take_left:
+            left_key = left.value if key is None else key(left.value)
+        else:
+            right_key = right.value if key is None else key(right.value)
+
 
 class LinkedList:
     def __init__(self):
@@ -12,6 +54,66 @@ class LinkedList:
         self.tail = None
         self.length = 0
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Build a linked list from the values of an iterable in one pass.
+        :param iterable: The values to add, in order.
+        :return: The new linked list.
+        """
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """
+        Iterate over the values of the linked list from head to tail.
+        """
+        current = self.head
+        while current is not None:
+            yield current.value
+            current = current.next
+
+    def extend(self, iterable):
+        """
+        Append every value of an iterable to the end of the linked list.
+        The nodes are linked in a single loop without calling append per value.
+        :param iterable: The values to add, in order.
+        """
+        if iterable is self:
+            iterable = list(self)
+
+        values = iter(iterable)
+        tail = self.tail
+        count = 0
+        if tail is None:
+            for value in values:
+                tail = self.head = Node(value)
+                count = 1
+                break
+            else:
+                return
+
+        for value in values:
+            node = Node(value)
+            tail.next = node
+            tail = node
+            count += 1
+
+        self.tail = tail
+        self.length += count
+
+    def clear(self):
+        """
+        Remove all nodes from the linked list.
+        """
+        self.head = None
+        self.tail = None
+        self.length = 0
+
     def print_list(self):
         """
         Method to print LinkedList values
@@ -243,22 +345,43 @@ class LinkedList:
             fast = fast.next
         return slow
     
-    def remove_duplicates(self):
+    def remove_duplicates(self, assume_sorted=False):
         """
-        Remove duplicate values from the linked list.
-        This method uses a set to track seen values.
+        Remove duplicate values from the linked list, keeping the first occurrence of each.
+        :param assume_sorted: Set to True if equal values are adjacent (e.g. the list is sorted);
+                              duplicates are then dropped by comparing neighbours, with no set
+                              and no hashing, so unhashable values work too.
+        By default this method uses a set to track seen values.
         """
+        removed = 0
+        if assume_sorted:
+            current = self.head
+            while current is not None:
+                value = current.value
+                following = current.next
+                while following is not None and following.value == value:
+                    following = following.next
+                    removed += 1
+                current.next = following
+                if following is None:
+                    self.tail = current
+                current = following
+            self.length -= removed
+            return
+
         values = set()
         previous = None
         current = self.head
         while current:
             if current.value in values:
                 previous.next = current.next
-                self.length -= 1
+                removed += 1
             else:
                 values.add(current.value)
                 previous = current
             current = current.next
+        self.tail = previous
+        self.length -= removed
 
     def binary_to_decimal(self):
         """
@@ -278,118 +401,91 @@ class LinkedList:
         :param x: The value to partition the list around.
         This method rearranges the nodes in place without creating new nodes.
         :return: None
-        1. Create two dummy nodes to hold the two partitions.
-        2. Traverse the original list and append nodes to the appropriate partition based on their value.
-        3. Connect the end of the first partition to the start of the second partition.
-        4. Update the head of the linked list to the start of the first partition.
-        5. Ensure the last node of the second partition points to None.
-        6. Handle edge cases where the list is empty or has only one node.
-        7. Time complexity: O(n), where n is the number of nodes in the linked list.
-        8. Space complexity: O(1), as we are not using any additional data structures that grow with input size.
-        9. This method modifies the original linked list in place.
-        10. The order of nodes in each partition is preserved.
-        11. This method does not return a new linked list but modifies the existing one.
+        1. Handle edge cases where the list is empty or has only one node.
+        2. Traverse the list once, appending each node to the "less" or the "more" chain;
+           each chain is tracked by its own head and tail, so no dummy nodes are needed.
+        3. Connect the tail of the "less" chain to the head of the "more" chain.
+        4. Update the head and tail of the linked list and terminate the last node with None.
+        5. Time complexity: O(n), where n is the number of nodes in the linked list.
+        6. Space complexity: O(1), no allocations at all.
+        7. The order of nodes in each partition is preserved.
         """
         if not self.head or not self.head.next:
             return
-        
-        dummy_1 = Node(0)
-        dummy_2 = Node(0)
-        
-        pre_1 = dummy_1
-        pre_2 = dummy_2
-        
+
+        less_head = less_tail = None
+        more_head = more_tail = None
+
         node = self.head
         while node is not None:
             if node.value < x:
-                pre_1.next = node
-                pre_1 = node
+                if less_tail is None:
+                    less_head = node
+                else:
+                    less_tail.next = node
+                less_tail = node
             else:
-                pre_2.next = node
-                pre_2 = node
-             
+                if more_tail is None:
+                    more_head = node
+                else:
+                    more_tail.next = node
+                more_tail = node
             node = node.next
-        
-        pre_2.next = None
-        pre_1.next = dummy_2.next
-        self.head = dummy_1.next
+
+        if less_tail is None:
+            self.head = more_head
+            self.tail = more_tail
+        elif more_tail is None:
+            self.head = less_head
+            self.tail = less_tail
+        else:
+            less_tail.next = more_head
+            self.head = less_head
+            self.tail = more_tail
+        self.tail.next = None
 
     def reverse_between(self, start_index, end_index):
         """        
         Reverse the nodes of the linked list from start_index to end_index (inclusive).
         :param start_index: The starting index of the sublist to reverse (0-based).
-        :param end_index: The ending index of the sublist to reverse (0-based).
+        :param end_index: The ending index of the sublist to reverse (0-based); clamped to the last index.
         :return: None
         This method reverses the nodes in place without creating new nodes.
-        1. Handle edge cases where the list is empty or has only one node.
-        2. If start_index is greater than or equal to end_index, do nothing.
-        3. Traverse the list to find the nodes at start_index and end_index.
-        4. Reverse the nodes between start_index and end_index by adjusting their next pointers.
-        5. Connect the reversed sublist back to the main list.
-        6. Update the head of the linked list if necessary.
-        7. Time complexity: O(n), where n is the number of nodes in the linked list.
-        8. Space complexity: O(1), as we are not using any additional data structures that grow with input size.
-        9. This method modifies the original linked list in place.
-        10. The order of nodes outside the reversed sublist remains unchanged.
-        11. This method does not return a new linked list but modifies the existing one.
-
-        Best solution
-
-        if not self.head or start_index >= end_index:
+        1. Handle edge cases where the list is empty or the range is empty.
+        2. Walk to the node at start_index, remembering the node before it.
+        3. Reverse the next pointers of the end_index - start_index + 1 nodes of the sublist.
+        4. Connect the reversed sublist back to the main list, updating the head
+           (if start_index is 0) and the tail (if the sublist ran to the end).
+        5. Time complexity: O(end_index), the list is not walked past the sublist.
+        6. Space complexity: O(1), no dummy node or other allocations.
+        """
+        if not self.head or start_index < 0 or start_index >= end_index:
             return
-        
-        dummy = Node(0)
-        dummy.next = self.head
-        prev = dummy
-        
-        # Move prev to the node before start_index
+        end_index = min(end_index, self.length - 1)
+        if start_index >= end_index:
+            return
+
+        before = None
+        start = self.head
         for _ in range(start_index):
-            prev = prev.next
-        
-        # Start reversing from start_index
-        current = prev.next
-        
-        # Reverse the sublist
-        for _ in range(end_index - start_index):
-            next_node = current.next
-            current.next = next_node.next
-            next_node.next = prev.next
-            prev.next = next_node
-        
-        # Update head if necessary
-        self.head = dummy.next
-        """
+            before = start
+            start = start.next
 
-        if not self.head or not self.head.next or start_index >= end_index:
-            return
-        
-        index = 0
-        pre = None
-        pre_start = start = end = post_end = None
-        current = self.head
-        
-        while current:
-            post = current.next
-            if index == start_index:
-                pre_start = pre
-                start = current
-            elif index == end_index:
-                end = current
-                post_end = post
-            
-            if start_index + 1 <= index <= end_index:
-                current.next = pre
-            
-            index += 1   
-            pre = current
-            current = post
-            
-        if pre_start:
-            pre_start.next = end
+        previous = None
+        current = start
+        for _ in range(end_index - start_index + 1):
+            following = current.next
+            current.next = previous
+            previous = current
+            current = following
+
+        if before is None:
+            self.head = previous
         else:
-            self.head = end
-            
-        start.next = post_end
+            before.next = previous
+        start.next = current
+        if current is None:
+            self.tail = start
 
     def swap_pairs(self):
         """        
@@ -397,37 +493,561 @@ class LinkedList:
         :return: None
         This method swaps nodes in pairs without creating new nodes.
         1. Handle edge cases where the list is empty or has only one node.
-        2. Create a dummy node to simplify the swapping logic.
-        3. Use a pointer to track the previous node to facilitate swapping.
-        4. Traverse the list in pairs and swap the nodes by adjusting their next pointers.
-        5. Update the head of the linked list to the new first node after swapping.
-        6. Ensure the last node of the swapped pair points to None.
-        7. Time complexity: O(n), where n is the number of nodes in the linked list.
-        8. Space complexity: O(1), as we are not using any additional data structures that grow with input size.
-        9. This method modifies the original linked list in place.
-        10. The order of nodes within each pair is reversed.
-        11. This method does not return a new linked list but modifies the existing one.
+        2. Traverse the list in pairs, tracking the last node of the previous pair,
+           and swap each pair by adjusting their next pointers.
+        3. The first swapped pair becomes the new head; no dummy node is needed.
+        4. Update the tail: the first node of the last pair, or the unpaired last node.
+        5. Time complexity: O(n), where n is the number of nodes in the linked list.
+        6. Space complexity: O(1), no allocations at all.
         """
-        
         if not self.head or not self.head.next:
             return
-        
-        dummy = Node(0)
-        dummy.next = self.head
-        prev = dummy
-        
-        while prev.next and prev.next.next:
-            first = prev.next
-            second = prev.next.next
-            
-            prev.next = second
+
+        previous = None
+        first = self.head
+        while first is not None and first.next is not None:
+            second = first.next
             first.next = second.next
             second.next = first
-            
-            prev = first
-        
-        self.head = dummy.next
-        dummy.next = None
+            if previous is None:
+                self.head = second
+            else:
+                previous.next = second
+            previous = first
+            first = first.next
+
+        self.tail = previous if first is None else first
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the linked list in place, like list.sort: stable, O(n log n).
+        Bottom-up merge sort that relinks the existing nodes: no recursion,
+        no new nodes and O(1) extra space.
+        :param key: A function computing the sort key of a value, or None to compare values.
+        :param reverse: Sort in descending order (equal values keep their order).
+        """
+        if self.length < 2:
+            return
+
+        head = self.head
+        tail = None
+        width = 1
+        while width < self.length:
+            merged_head = merged_tail = None
+            current = head
+            while current is not None:
+                left = left_tail = current
+                for _ in range(width - 1):
+                    if left_tail.next is None:
+                        break
+                    left_tail = left_tail.next
+                right = left_tail.next
+                left_tail.next = None
+
+                if right is None:
+                    run_head, run_tail = left, left_tail
+                    current = None
+                else:
+                    right_tail = right
+                    for _ in range(width - 1):
+                        if right_tail.next is None:
+                            break
+                        right_tail = right_tail.next
+                    current = right_tail.next
+                    right_tail.next = None
+                    run_head, run_tail = _merge_runs(left, left_tail, right, right_tail, key, reverse)
+
+                if merged_tail is None:
+                    merged_head = run_head
+                else:
+                    merged_tail.next = run_head
+                merged_tail = run_tail
+
+            head = merged_head
+            tail = merged_tail
+            width *= 2
+
+        self.head = head
+        self.tail = tail
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge another sorted linked list into this sorted one in linear time by
+        relinking nodes. Stable: on ties nodes of this list come first.
+        The other list is left empty.
+        :param other: A LinkedList sorted with the same key and reverse.
+        :param key: The function the lists are sorted by, or None.
+        :param reverse: True if the lists are sorted in descending order.
+        """
+        if other is self:
+            raise ValueError("cannot merge a linked list with itself")
+
+        if other.head is not None:
+            if self.head is None:
+                self.head, self.tail = other.head, other.tail
+            else:
+                self.head, self.tail = _merge_runs(self.head, self.tail, other.head, other.tail, key, reverse)
+            self.length += other.length
+
+        other.clear()
+
+
+class TrackedLinkedList(LinkedList):
+    """
+    A LinkedList that also keeps a deque of its nodes in order (the "spine").
+    The spine gives every node's predecessor without walking the list, so pop
+    (remove from the end) is O(1) instead of O(n), and pop_first stays O(1).
+    get(index) reads the spine directly. It keeps the LinkedList API; methods that
+    relink many nodes at once rebuild the spine in the same O(n) pass they already cost.
+    """
+    def __init__(self):
+        """
+        Initialize an empty tracked linked list.
+        """
+        super().__init__()
+        self._spine = deque()
+
+    def _resync(self):
+        """
+        Rebuild the spine from the node links and fix tail.
+        """
+        self._spine = deque()
+        current = self.head
+        while current is not None:
+            self._spine.append(current)
+            current = current.next
+        self.tail = self._spine[-1] if self._spine else None
+
+    def clear(self):
+        """
+        Remove all nodes from the linked list.
+        """
+        super().clear()
+        self._spine = deque()
+
+    def append(self, value):
+        """
+        Append a new node with the given value to the end of the linked list.
+        :param value: The value to be added to the linked list.
+        """
+        super().append(value)
+        self._spine.append(self.tail)
+
+    def extend(self, iterable):
+        """
+        Append every value of an iterable to the end of the linked list.
+        :param iterable: The values to add, in order.
+        """
+        tail = self.tail
+        super().extend(iterable)
+        current = self.head if tail is None else tail.next
+        while current is not None:
+            self._spine.append(current)
+            current = current.next
+
+    def pop(self):
+        """
+        Remove and return the last node in O(1).
+        :return: The last node, or None if the list is empty.
+        """
+        if self.head is None:
+            return None
+
+        node = self._spine.pop()
+        if self._spine:
+            self.tail = self._spine[-1]
+            self.tail.next = None
+        else:
+            self.head = self.tail = None
+
+        self.length -= 1
+        return node
+
+    def prepend(self, value):
+        """
+        Add a new node with the given value to the beginning of the linked list.
+        :param value: The value to be added to the linked list.
+        """
+        node = Node(value)
+        node.next = self.head
+        self.head = node
+        if self.tail is None:
+            self.tail = node
+        self._spine.appendleft(node)
+        self.length += 1
+
+    def pop_first(self):
+        """
+        Remove and return the first node in O(1).
+        :return: The first node, or None if the list is empty.
+        """
+        if self.head is None:
+            return None
+
+        node = self._spine.popleft()
+        self.head = node.next
+        if self.head is None:
+            self.tail = None
+        node.next = None
+        self.length -= 1
+        return node
+
+    def get(self, index):
+        """
+        Get the node at the specified index from the spine.
+        :param index: The index of the node to retrieve.
+        :return: The node at the specified index, or None if the index is out of bounds.
+        """
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer")
+
+        if index < 0 or index >= self.length:
+            return None
+        return self._spine[index]
+
+    def insert(self, index, value):
+        """
+        Insert a new node with the given value at the specified index.
+        :param index: The index at which to insert the new node.
+        :param value: The value to be added to the linked list.
+        """
+        if not isinstance(index, int) or index <= 0 or index >= self.length:
+            return super().insert(index, value)
+
+        super().insert(index, value)
+        self._spine.insert(index, self._spine[index - 1].next)
+        return True
+
+    def remove(self, index):
+        """
+        Remove the node at the specified index.
+        :param index: The index of the node to remove.
+        :return: The removed node, or None if the index is out of bounds.
+        """
+        if not isinstance(index, int) or index <= 0 or index >= self.length - 1:
+            return super().remove(index)
+
+        node = super().remove(index)
+        del self._spine[index]
+        return node
+
+    def reverse(self):
+        """
+        Reverse the linked list in place.
+        """
+        super().reverse()
+        self._spine.reverse()
+
+    def remove_duplicates(self, assume_sorted=False):
+        """
+        Remove duplicate values from the linked list.
+        :param assume_sorted: Set to True if equal values are adjacent, to skip hashing.
+        """
+        super().remove_duplicates(assume_sorted)
+        self._resync()
+
+    def partition_list(self, x):
+        """
+        Partition the linked list around x, keeping the relative order in each part.
+        :param x: The value to partition the list around.
+        """
+        super().partition_list(x)
+        self._resync()
+
+    def reverse_between(self, start_index, end_index):
+        """
+        Reverse the nodes from start_index to end_index (inclusive).
+        :param start_index: The starting index of the sublist to reverse (0-based).
+        :param end_index: The ending index of the sublist to reverse (0-based).
+        """
+        super().reverse_between(start_index, end_index)
+        self._resync()
+
+    def swap_pairs(self):
+        """
+        Swap every two adjacent nodes in the linked list.
+        """
+        super().swap_pairs()
+        self._resync()
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the linked list in place (stable, O(n log n)).
+        :param key: A function computing the sort key of a value, or None to compare values.
+        :param reverse: Sort in descending order.
+        """
+        super().sort(key, reverse)
+        self._resync()
+
+    def merge_sorted(self, other, key=None, reverse=False):
+        """
+        Merge another sorted linked list into this sorted one; the other list is left empty.
+        :param other: A LinkedList sorted with the same key and reverse.
+        :param key: The function the lists are sorted by, or None.
+        :param reverse: True if the lists are sorted in descending order.
+        """
+        super().merge_sorted(other, key, reverse)
+        self._resync()
+
+
+class _Block:
+    """
+    A node of an unrolled linked list: a list of up to capacity values and a reference to the next block.
+    """
+    __slots__ = ("values", "next")
+
+    def __init__(self, values):
+        self.values = values
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """
+    An unrolled linked list: each node (block) holds up to capacity values in a
+    Python list instead of one value per node. This needs far fewer node objects,
+    keeps neighbouring values together in memory, and lets get(index) skip a whole
+    block per step. It provides the LinkedList API, except that get, pop, pop_first
+    and remove return values since values do not have nodes of their own.
+    """
+    def __init__(self, capacity=64):
+        """
+        Initialize an empty unrolled linked list.
+        :param capacity: The maximum number of values per block.
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, capacity=64):
+        """
+        Build an unrolled linked list from the values of an iterable, filling whole blocks.
+        :param iterable: The values to add, in order.
+        :param capacity: The maximum number of values per block.
+        :return: The new list.
+        """
+        linked_list = cls(capacity)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """
+        Iterate over the values from head to tail.
+        """
+        block = self.head
+        while block is not None:
+            yield from block.values
+            block = block.next
+
+    def print_list(self):
+        """
+        Method to print UnrolledLinkedList values
+        """
+        for value in self:
+            print(value)
+
+    def extend(self, iterable):
+        """
+        Append every value of an iterable, topping up the tail block and then
+        filling new blocks with capacity values each.
+        :param iterable: The values to add, in order.
+        """
+        if iterable is self:
+            iterable = list(self)
+
+        values = iter(iterable)
+        if self.tail is not None:
+            room = self.capacity - len(self.tail.values)
+            chunk = list(islice(values, room))
+            self.tail.values.extend(chunk)
+            self.length += len(chunk)
+            if len(chunk) < room:
+                return
+
+        while True:
+            chunk = list(islice(values, self.capacity))
+            if not chunk:
+                return
+            self.__link_last(_Block(chunk))
+            self.length += len(chunk)
+
+    def __link_last(self, block):
+        if self.tail is None:
+            self.head = self.tail = block
+        else:
+            self.tail.next = block
+            self.tail = block
+
+    def __locate(self, index):
+        """
+        Find the block holding index by skipping whole blocks.
+        :return: (previous block, block, offset of index inside the block)
+        """
+        previous = None
+        block = self.head
+        while index >= len(block.values):
+            index -= len(block.values)
+            previous = block
+            block = block.next
+        return previous, block, index
+
+    def append(self, value):
+        """
+        Append a value to the end of the list.
+        :param value: The value to be added to the list.
+        """
+        if self.tail is None or len(self.tail.values) >= self.capacity:
+            self.__link_last(_Block([value]))
+        else:
+            self.tail.values.append(value)
+        self.length += 1
+
+    def prepend(self, value):
+        """
+        Add a value to the beginning of the list.
+        :param value: The value to be added to the list.
+        """
+        if self.head is None or len(self.head.values) >= self.capacity:
+            block = _Block([value])
+            block.next = self.head
+            self.head = block
+            if self.tail is None:
+                self.tail = block
+        else:
+            self.head.values.insert(0, value)
+        self.length += 1
+
+    def get(self, index):
+        """
+        Get the value at the specified index.
+        :param index: The index of the value to retrieve.
+        :return: The value at the specified index, or None if the index is out of bounds.
+        """
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer")
+
+        if index < 0 or index >= self.length:
+            return None
+
+        _, block, offset = self.__locate(index)
+        return block.values[offset]
+
+    def set_value(self, index, value):
+        """
+        Set the value at the specified index.
+        :param index: The index of the value to update.
+        :param value: The new value.
+        """
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer")
+
+        if index < 0 or index >= self.length:
+            return False
+
+        _, block, offset = self.__locate(index)
+        block.values[offset] = value
+        return True
+
+    def insert(self, index, value):
+        """
+        Insert a value at the specified index, splitting the block if it overflows.
+        :param index: The index at which to insert the value.
+        :param value: The value to be added to the list.
+        """
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer")
+
+        if index < 0 or index > self.length:
+            return False
+
+        if index == self.length:
+            self.append(value)
+            return True
+
+        _, block, offset = self.__locate(index)
+        block.values.insert(offset, value)
+        self.length += 1
+        if len(block.values) > self.capacity:
+            half = len(block.values) // 2
+            new_block = _Block(block.values[half:])
+            del block.values[half:]
+            new_block.next = block.next
+            block.next = new_block
+            if self.tail is block:
+                self.tail = new_block
+        return True
+
+    def remove(self, index):
+        """
+        Remove the value at the specified index, merging underfull neighbouring blocks.
+        :param index: The index of the value to remove.
+        :return: The removed value, or None if the index is out of bounds.
+        """
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer")
+
+        if index < 0 or index >= self.length:
+            return None
+
+        previous, block, offset = self.__locate(index)
+        value = block.values.pop(offset)
+        self.length -= 1
+
+        if not block.values:
+            if previous is None:
+                self.head = block.next
+            else:
+                previous.next = block.next
+            if self.tail is block:
+                self.tail = previous
+            block.next = None
+        elif block.next is not None and len(block.values) + len(block.next.values) <= self.capacity // 2:
+            merged = block.next
+            block.values.extend(merged.values)
+            block.next = merged.next
+            if self.tail is merged:
+                self.tail = block
+            merged.next = None
+        return value
+
+    def pop(self):
+        """
+        Remove and return the last value.
+        :return: The last value, or None if the list is empty.
+        """
+        if self.length == 0:
+            return None
+        return self.remove(self.length - 1)
+
+    def pop_first(self):
+        """
+        Remove and return the first value.
+        :return: The first value, or None if the list is empty.
+        """
+        if self.length == 0:
+            return None
+        return self.remove(0)
+
+    def reverse(self):
+        """
+        Reverse the list in place by reversing the block order and each block's values.
+        """
+        previous = None
+        block = self.head
+        self.tail = block
+        while block is not None:
+            block.values.reverse()
+            following = block.next
+            block.next = previous
+            previous = block
+            block = following
+        self.head = previous
 
 
 if __name__ == "__main__":
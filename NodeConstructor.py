@@ -0,0 +1,27 @@
+"""
+Node classes shared by the linked list, stack and queue modules.
+Nodes declare __slots__, so an instance stores only its fields and has no
+per-instance __dict__. This matters for structures with millions of nodes.
+"""
+
+class Node:
+    """
+    A node of a singly linked structure: a value and a reference to the next node.
+    """
+    __slots__ = ("value", "next")
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+
+
+class DoublyNode:
+    """
+    A node of a doubly linked structure: a value and references to the next and previous nodes.
+    """
+    __slots__ = ("value", "next", "prev")
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+        self.prev = None
@@ -0,0 +1,216 @@
+"""
+An indexable skip list: a sorted linked list with express lanes.
+Terminology:
+- Level: Every node is linked on level 0 and, with probability p per extra level, on higher levels.
+  Higher levels skip over many nodes, so searches take O(log n) expected steps.
+- Span: For each level, the number of level-0 positions a link jumps over. Summing spans along
+  a search path gives a node's index, which makes get(index) O(log n) as well.
+- Stable insertion: Equal values keep their insertion order (a new value goes after its equals).
+"""
+
+import random
+
+
+class SkipNode:
+    """
+    A skip list node: a value plus one forward link and one span per level it appears on.
+    """
+    __slots__ = ("value", "next", "span")
+
+    def __init__(self, value, level):
+        self.value = value
+        self.next = [None] * level
+        self.span = [0] * level
+
+
+class SkipList:
+    """
+    A sorted list of values with O(log n) expected insert, search, remove and get(index).
+    Duplicate values are allowed and kept in insertion order.
+    """
+    MAX_LEVEL = 32
+
+    def __init__(self, p=0.5):
+        """
+        Initializes an empty skip list.
+        :param p: The probability that a node is promoted to the next level.
+        """
+        self.p = p
+        self.head = SkipNode(None, self.MAX_LEVEL)
+        self.head.span = [1] * self.MAX_LEVEL
+        self.level = 1
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, p=0.5):
+        """
+        Builds a skip list holding the values of an iterable.
+        :param iterable: The values to insert, in any order.
+        :param p: The promotion probability.
+        :return: The new skip list.
+        """
+        skip_list = cls(p)
+        for value in iterable:
+            skip_list.insert(value)
+        return skip_list
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """
+        Iterates over the values in sorted order.
+        """
+        node = self.head.next[0]
+        while node is not None:
+            yield node.value
+            node = node.next[0]
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def _random_level(self):
+        level = 1
+        while level < self.MAX_LEVEL and random.random() < self.p:
+            level += 1
+        return level
+
+    def insert(self, value):
+        """
+        Inserts a value after any equal values already in the list.
+        :param value: The value to insert.
+        """
+        update = [None] * self.MAX_LEVEL
+        positions = [0] * self.MAX_LEVEL
+        node = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and not value < node.next[i].value:
+                position += node.span[i]
+                node = node.next[i]
+            update[i] = node
+            positions[i] = position
+
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                update[i] = self.head
+                positions[i] = 0
+                self.head.next[i] = None
+                self.head.span[i] = self.length + 1
+            self.level = level
+
+        new_node = SkipNode(value, level)
+        new_position = positions[0] + 1
+        for i in range(level):
+            previous = update[i]
+            new_node.next[i] = previous.next[i]
+            new_node.span[i] = positions[i] + previous.span[i] + 1 - new_position
+            previous.next[i] = new_node
+            previous.span[i] = new_position - positions[i]
+        for i in range(level, self.level):
+            update[i].span[i] += 1
+        self.length += 1
+
+    def search(self, value):
+        """
+        Checks if the skip list contains a value.
+        :param value: The value to look for.
+        :return: True if the value is in the list, False otherwise.
+        """
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].value < value:
+                node = node.next[i]
+        node = node.next[0]
+        return node is not None and node.value == value
+
+    def index(self, value):
+        """
+        Returns the index of the first occurrence of a value, or -1 if it is not in the list.
+        :param value: The value to look for.
+        """
+        node = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].value < value:
+                position += node.span[i]
+                node = node.next[i]
+        node = node.next[0]
+        if node is not None and node.value == value:
+            return position
+        return -1
+
+    def remove(self, value):
+        """
+        Removes the first occurrence of a value.
+        :param value: The value to remove.
+        :return: True if the value was removed, False if it is not in the list.
+        """
+        update = [None] * self.level
+        node = self.head
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and node.next[i].value < value:
+                node = node.next[i]
+            update[i] = node
+
+        target = node.next[0]
+        if target is None or target.value != value:
+            return False
+
+        for i in range(self.level):
+            previous = update[i]
+            if previous.next[i] is target:
+                previous.span[i] += target.span[i] - 1
+                previous.next[i] = target.next[i]
+            else:
+                previous.span[i] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.length -= 1
+        return True
+
+    def get(self, index):
+        """
+        Returns the value at the specified index in sorted order.
+        :param index: The index of the value to retrieve.
+        :return: The value at the index, or None if the index is out of bounds.
+        """
+        if not isinstance(index, int):
+            raise TypeError("Index must be an integer")
+
+        if index < 0 or index >= self.length:
+            return None
+
+        target = index + 1
+        node = self.head
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.next[i] is not None and position + node.span[i] <= target:
+                position += node.span[i]
+                node = node.next[i]
+            if position == target:
+                return node.value
+        return node.value
+
+    def level_stats(self):
+        """
+        Reports how many nodes reach each level.
+        :return: A list where item i is the number of nodes linked on level i
+                 (about n * p**i for a well-distributed list).
+        """
+        counts = [0] * self.level
+        node = self.head.next[0]
+        while node is not None:
+            for i in range(len(node.next)):
+                counts[i] += 1
+            node = node.next[0]
+        return counts
+
+
+if __name__ == "__main__":
+    events = SkipList.from_iterable([30, 10, 20, 10, 40])
+    print(list(events))  # Output: [10, 10, 20, 30, 40]
+    print(events.get(2), events.search(30), events.index(40))  # Output: 20 True 4
+    events.remove(10)
+    print(list(events), events.level_stats())
@@ -1,7 +1,5 @@
-class Node:
-    def __init__(self, value):
-        self.value = value
-        self.next = None
+from NodeConstructor import Node
+
 
 class Stack:
     """
@@ -10,27 +10,96 @@ Terminology:
 - perfect binary tree: A full binary tree where all leaves are at the same level
 - complete binary tree: A binary tree where all levels are fully filled except possibly for the last level, which is filled from left to right
 - binary search tree: A binary tree where for each node, all values in the left subtree are less than the node's value, and all values in the right subtree are greater than the node's value
+- Subtree size: The number of nodes in the subtree rooted at a node, used for rank/select (order statistic) queries
+- Traversal: Visiting every node once, in-order (left, node, right), pre-order (node, left, right), post-order (left, right, node) or level-order (breadth-first)
+- AVL tree: A self-balancing binary search tree where the heights of the two child subtrees of any node differ by at most one
+- B-tree: A balanced search tree whose nodes hold many sorted keys in a contiguous block, so a lookup touches few nodes
 """
 
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+
 class Node:
     """
     A class representing a node in a binary tree.
     Each node contains a value and references to its left and right children.
+    size is the number of nodes in the subtree rooted at this node.
     """
+    __slots__ = ("value", "left", "right", "size")
+
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
+        self.size = 1
 
 class BinarySearchTree:
     """
     A class representing a binary search tree.
     It provides methods to insert values, search for values,
     and traverse the tree in various orders (in-order, pre-order, post-order).
+    Every node keeps the size of its subtree, which answers rank/select queries in O(height).
     """
+    node_class = Node
+
     def __init__(self):
         self.root = None
 
+    @classmethod
+    def from_sorted(cls, iterable):
+        """
+        Builds a perfectly balanced tree from values given in ascending order in O(n).
+        Repeated values are kept once, as insert would do.
+        Raises ValueError if the input is not sorted.
+        """
+        values = []
+        append = values.append
+        for value in iterable:
+            if values:
+                last = values[-1]
+                if value == last:
+                    continue
+                if value < last:
+                    raise ValueError("from_sorted requires values in ascending order")
+            append(value)
+
+        tree = cls()
+        tree.root = tree.__build(values, 0, len(values) - 1)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Builds a perfectly balanced tree from values in any order.
+        Sorts once in O(n log n), then bulk-loads with from_sorted.
+        """
+        return cls.from_sorted(sorted(iterable))
+
+    def __build(self, values, lo, hi):
+        """
+        Links values[lo..hi] into a balanced subtree rooted at the middle value.
+        The recursion depth is log2(n).
+        """
+        if lo > hi:
+            return None
+
+        mid = (lo + hi) // 2
+        node = self.node_class(values[mid])
+        node.left = self.__build(values, lo, mid - 1)
+        node.right = self.__build(values, mid + 1, hi)
+        self._update_node(node)
+        return node
+
+    def _update_node(self, node):
+        """
+        Recomputes the subtree size of a node after its children change.
+        Subclasses that store more per-node data (e.g. heights) extend this.
+        """
+        left = node.left.size if node.left is not None else 0
+        right = node.right.size if node.right is not None else 0
+        node.size = left + right + 1
+
     def insert(self, value):
         """
         Inserts a value into the binary search tree.
@@ -41,20 +110,26 @@ class BinarySearchTree:
             return True
         
         temp = self.root
+        path = []
         while True:
             if value == temp.value:
                 return False
             
+            path.append(temp)
             if value < temp.value:
                 if temp.left is None:
                     temp.left = node
-                    return True
+                    break
                 temp = temp.left
             else:
                 if temp.right is None:
                     temp.right = node
-                    return True
+                    break
                 temp = temp.right
+
+        for temp in path:
+            temp.size += 1
+        return True
         
     def contains(self, value):
         """
@@ -104,6 +179,7 @@ class BinarySearchTree:
         elif value > node.value:
             node.right = self.__r_insert(node.right, value)
         
+        self._update_node(node)
         return node
     
     def r_delete(self, value):
@@ -133,6 +209,7 @@ class BinarySearchTree:
             node.value = temp.value
             node.right = self.__r_delete(node.right, temp.value)
         
+        self._update_node(node)
         return node
     
     def __min_value_node(self, node):
@@ -143,3 +220,609 @@ class BinarySearchTree:
         while current.left is not None:
             current = current.left
         return current
+
+    def delete(self, value):
+        """
+        Iteratively deletes a value from the binary search tree.
+        Unlike r_delete it uses no recursion, so it works on degenerate trees of any depth.
+        Returns True if the value was found and removed, False otherwise.
+        """
+        path = []
+        node = self.root
+        while node is not None and value != node.value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+
+        for parent in path:
+            parent.size -= 1
+        return True
+
+    def __iter__(self):
+        return self.in_order()
+
+    def __len__(self):
+        return self.root.size if self.root is not None else 0
+
+    def min(self):
+        """
+        Returns the smallest value in the tree, or None if the tree is empty.
+        """
+        if self.root is None:
+            return None
+        return self.__min_value_node(self.root).value
+
+    def max(self):
+        """
+        Returns the largest value in the tree, or None if the tree is empty.
+        """
+        node = self.root
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return node.value
+
+    def floor(self, value):
+        """
+        Returns the largest value in the tree that is less than or equal to value,
+        or None if there is no such value.
+        """
+        result = None
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return node.value
+            if value < node.value:
+                node = node.left
+            else:
+                result = node.value
+                node = node.right
+        return result
+
+    def ceiling(self, value):
+        """
+        Returns the smallest value in the tree that is greater than or equal to value,
+        or None if there is no such value.
+        """
+        result = None
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return node.value
+            if value > node.value:
+                node = node.right
+            else:
+                result = node.value
+                node = node.left
+        return result
+
+    def range(self, lo, hi):
+        """
+        Lazily yields, in sorted order, every value v with lo <= v <= hi.
+        Subtrees that lie entirely outside the range are never visited,
+        so the cost is O(height + number of values yielded).
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                if node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if node.value > hi:
+                    return
+                yield node.value
+                node = node.right
+
+    def rank(self, value):
+        """
+        Returns the number of values in the tree that are strictly less than value.
+        """
+        rank = 0
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            else:
+                left_size = node.left.size if node.left is not None else 0
+                if value == node.value:
+                    return rank + left_size
+                rank += left_size + 1
+                node = node.right
+        return rank
+
+    def select(self, k):
+        """
+        Returns the k-th smallest value in the tree (0-based),
+        or None if k is out of bounds.
+        """
+        if k < 0 or k >= len(self):
+            return None
+
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left is not None else 0
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.value
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def in_order(self):
+        """
+        Lazily yields the values of the tree in sorted (left, node, right) order.
+        Uses an explicit stack bounded by the tree height instead of recursion.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.value
+                node = node.right
+
+    def pre_order(self):
+        """
+        Lazily yields the values of the tree in (node, left, right) order.
+        """
+        if self.root is None:
+            return
+
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def post_order(self):
+        """
+        Lazily yields the values of the tree in (left, right, node) order.
+        """
+        stack = []
+        last = None
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right is not None and top.right is not last:
+                    node = top.right
+                else:
+                    yield top.value
+                    last = stack.pop()
+
+    def level_order(self):
+        """
+        Lazily yields the values of the tree level by level (breadth-first), left to right.
+        """
+        if self.root is None:
+            return
+
+        queue = deque([self.root])
+        while queue:
+            node = queue.popleft()
+            yield node.value
+            if node.left is not None:
+                queue.append(node.left)
+            if node.right is not None:
+                queue.append(node.right)
+
+    def height(self):
+        """
+        Returns the height of the tree (number of edges on the longest root-to-leaf path).
+        An empty tree has height -1. Computed iteratively so degenerate trees do not
+        hit the recursion limit.
+        """
+        if self.root is None:
+            return -1
+
+        height = -1
+        level = [self.root]
+        while level:
+            height += 1
+            next_level = []
+            for node in level:
+                if node.left is not None:
+                    next_level.append(node.left)
+                if node.right is not None:
+                    next_level.append(node.right)
+            level = next_level
+        return height
+
+
+class AVLNode(Node):
+    """
+    A binary tree node that also stores the height of its subtree (a leaf has height 1).
+    """
+    __slots__ = ("height",)
+
+    def __init__(self, value):
+        super().__init__(value)
+        self.height = 1
+
+
+class AVLTree(BinarySearchTree):
+    """
+    A self-balancing binary search tree (AVL tree).
+    After every insert and delete the heights of the left and right subtrees of
+    each node differ by at most one, so the tree height stays O(log n) even for
+    sorted or reverse-sorted input.
+    It keeps the BinarySearchTree API: insert, contains, r_contains, r_insert, delete, r_delete
+    and the traversal generators.
+    """
+    node_class = AVLNode
+
+    def insert(self, value):
+        """
+        Inserts a value into the AVL tree and rebalances the path back to the root.
+        Returns False if the value is already present.
+        """
+        if self.root is None:
+            self.root = AVLNode(value)
+            return True
+
+        path = []
+        temp = self.root
+        while temp is not None:
+            if value == temp.value:
+                return False
+            path.append(temp)
+            temp = temp.left if value < temp.value else temp.right
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = AVLNode(value)
+        else:
+            parent.right = AVLNode(value)
+
+        self.__retrace(path)
+        return True
+
+    def r_insert(self, value):
+        """
+        Inserts a value into the AVL tree.
+        The tree height is O(log n), so this simply delegates to insert.
+        """
+        self.insert(value)
+
+    def r_delete(self, value):
+        """
+        Deletes a value from the AVL tree.
+        The tree height is O(log n), so this simply delegates to delete.
+        """
+        self.delete(value)
+
+    def delete(self, value):
+        """
+        Deletes a value from the AVL tree and rebalances the path back to the root.
+        Returns True if the value was found and removed, False otherwise.
+        """
+        path = []
+        node = self.root
+        while node is not None and value != node.value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+
+        self.__retrace(path)
+        return True
+
+    def height(self):
+        """
+        Returns the height of the tree in O(1) from the stored node heights.
+        """
+        if self.root is None:
+            return -1
+        return self.root.height - 1
+
+    def __retrace(self, path):
+        """
+        Walks the insertion/deletion path bottom-up, updating heights and
+        replacing each subtree by its rebalanced version.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            balanced = self.__rebalance(node)
+            if balanced is node:
+                continue
+            if i == 0:
+                self.root = balanced
+            elif path[i - 1].left is node:
+                path[i - 1].left = balanced
+            else:
+                path[i - 1].right = balanced
+
+    def __height(self, node):
+        return node.height if node is not None else 0
+
+    def _update_node(self, node):
+        super()._update_node(node)
+        left = self.__height(node.left)
+        right = self.__height(node.right)
+        node.height = (left if left > right else right) + 1
+
+    def __balance(self, node):
+        return self.__height(node.left) - self.__height(node.right)
+
+    def __rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+
+    def __rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+
+    def __rebalance(self, node):
+        """
+        Restores the AVL property at node and returns the new root of the subtree.
+        """
+        self._update_node(node)
+        balance = self.__balance(node)
+        if balance > 1:
+            if self.__balance(node.left) < 0:
+                node.left = self.__rotate_left(node.left)
+            return self.__rotate_right(node)
+        if balance < -1:
+            if self.__balance(node.right) > 0:
+                node.right = self.__rotate_right(node.right)
+            return self.__rotate_left(node)
+        return node
+
+
+class SortedList:
+    """
+    A sorted container of unique values stored as a list of sorted blocks,
+    i.e. a two-level B+ tree: a top-level list of block maxima is searched with
+    bisect, then the value is located inside one contiguous block.
+    Compared to the pointer-based trees this keeps values in a few large Python
+    lists instead of one object per value, so lookups and iteration are much
+    faster and there is no per-value node allocation.
+    It provides the BinarySearchTree API: insert, contains, delete, r_delete,
+    in_order iteration, min/max and range queries.
+    """
+    def __init__(self, load=1000):
+        """
+        :param load: Target block size (at least 1); blocks are split at twice this size
+                     and merged with a neighbour below half of it.
+        """
+        if load < 1:
+            raise ValueError("load must be at least 1")
+        self.load = load
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+
+    @classmethod
+    def from_sorted(cls, iterable, load=1000):
+        """
+        Builds the container from values given in ascending order in O(n).
+        Repeated values are kept once. Raises ValueError if the input is not sorted.
+        """
+        container = cls(load)
+        values = []
+        append = values.append
+        for value in iterable:
+            if values:
+                last = values[-1]
+                if value == last:
+                    continue
+                if value < last:
+                    raise ValueError("from_sorted requires values in ascending order")
+            append(value)
+
+        container._blocks = [values[i:i + load] for i in range(0, len(values), load)]
+        container._maxes = [block[-1] for block in container._blocks]
+        container._len = len(values)
+        return container
+
+    @classmethod
+    def from_iterable(cls, iterable, load=1000):
+        """
+        Builds the container from values in any order by sorting once.
+        """
+        return cls.from_sorted(sorted(iterable), load)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return self.in_order()
+
+    def in_order(self):
+        """
+        Lazily yields the values in sorted order.
+        """
+        for block in self._blocks:
+            yield from block
+
+    def insert(self, value):
+        """
+        Inserts a value. Returns False if the value is already present.
+        """
+        maxes = self._maxes
+        if not maxes:
+            self._blocks.append([value])
+            maxes.append(value)
+            self._len = 1
+            return True
+
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            i -= 1
+            block = self._blocks[i]
+            block.append(value)
+            maxes[i] = value
+        else:
+            block = self._blocks[i]
+            j = bisect_left(block, value)
+            if block[j] == value:
+                return False
+            block.insert(j, value)
+
+        self._len += 1
+        if len(block) > 2 * self.load:
+            self.__split(i)
+        return True
+
+    def contains(self, value):
+        """
+        Checks if the container holds a specific value.
+        """
+        maxes = self._maxes
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            return False
+        block = self._blocks[i]
+        return block[bisect_left(block, value)] == value
+
+    def __contains__(self, value):
+        return self.contains(value)
+
+    def delete(self, value):
+        """
+        Deletes a value. Returns True if the value was found and removed, False otherwise.
+        """
+        maxes = self._maxes
+        i = bisect_left(maxes, value)
+        if i == len(maxes):
+            return False
+        block = self._blocks[i]
+        j = bisect_left(block, value)
+        if block[j] != value:
+            return False
+
+        del block[j]
+        self._len -= 1
+        if not block:
+            del self._blocks[i]
+            del maxes[i]
+        else:
+            maxes[i] = block[-1]
+            if len(block) < self.load // 2:
+                self.__merge(i)
+        return True
+
+    def r_delete(self, value):
+        """
+        Deletes a value (no recursion is involved; kept for BinarySearchTree compatibility).
+        """
+        self.delete(value)
+
+    def min(self):
+        """
+        Returns the smallest value, or None if the container is empty.
+        """
+        return self._blocks[0][0] if self._blocks else None
+
+    def max(self):
+        """
+        Returns the largest value, or None if the container is empty.
+        """
+        return self._maxes[-1] if self._maxes else None
+
+    def range(self, lo, hi):
+        """
+        Lazily yields, in sorted order, every value v with lo <= v <= hi.
+        """
+        blocks = self._blocks
+        i = bisect_left(self._maxes, lo)
+        if i == len(blocks):
+            return
+        j = bisect_left(blocks[i], lo)
+        while i < len(blocks):
+            block = blocks[i]
+            end = bisect_right(block, hi)
+            yield from block[j:end]
+            if end < len(block):
+                return
+            i += 1
+            j = 0
+
+    def __split(self, i):
+        """
+        Splits block i in two halves.
+        """
+        block = self._blocks[i]
+        half = block[self.load:]
+        del block[self.load:]
+        self._blocks.insert(i + 1, half)
+        self._maxes.insert(i, block[-1])
+
+    def __merge(self, i):
+        """
+        Merges the underfull block i with its right neighbour (or its left one
+        for the last block), splitting again if the result is too large.
+        """
+        if len(self._blocks) == 1:
+            return
+        if i == len(self._blocks) - 1:
+            i -= 1
+
+        block = self._blocks[i]
+        block.extend(self._blocks[i + 1])
+        del self._blocks[i + 1]
+        del self._maxes[i]
+        self._maxes[i] = block[-1]
+        if len(block) > 2 * self.load:
+            self.__split(i)